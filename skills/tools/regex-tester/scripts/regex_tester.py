@@ -6,6 +6,7 @@ Based on Python's re: https://github.com/python/cpython
 Usage:
     python regex_tester.py "\\d+" "abc123def456"
     python regex_tester.py "(\\w+)@(\\w+)" "user@domain" --groups
+    python regex_tester.py --pattern email "Contact: test@example.com"
 """
 
 import argparse
@@ -23,13 +24,24 @@ COMMON_PATTERNS = {
     'uuid': r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
 }
 
+_COMMON_COMPILED = {name: re.compile(p) for name, p in COMMON_PATTERNS.items()}
+
+# COMMON_PATTERNS is constant, so the --list output is built once at import
+_LIST_TEXT = "Common patterns:\n" + "".join(
+    f"  {name}: {pattern}\n" for name, pattern in COMMON_PATTERNS.items()
+)
+
 def test_regex(pattern, text, flags=0, show_groups=False, find_all=False):
-    """Test regex pattern against text."""
-    try:
-        regex = re.compile(pattern, flags)
-    except re.error as e:
-        print(f"Invalid regex: {e}", file=sys.stderr)
-        sys.exit(1)
+    """Test regex pattern (string or precompiled) against text."""
+    if isinstance(pattern, re.Pattern):
+        regex = pattern
+        pattern = regex.pattern
+    else:
+        try:
+            regex = re.compile(pattern, flags)
+        except re.error as e:
+            print(f"Invalid regex: {e}", file=sys.stderr)
+            sys.exit(1)
     
     if find_all:
         matches = regex.findall(text)
@@ -75,12 +87,15 @@ def main():
     args = parser.parse_args()
     
     if args.list:
-        print("Common patterns:")
-        for name, pattern in COMMON_PATTERNS.items():
-            print(f"  {name}: {pattern}")
+        sys.stdout.write(_LIST_TEXT)
         return
     
     pattern = COMMON_PATTERNS.get(args.pattern) if args.pattern else args.regex
+    if args.pattern and args.text is None:
+        # With --pattern the single positional argument is the text; argparse
+        # fills 'regex' first, so move it over (otherwise the documented
+        # `--pattern email "text"` form always failed with a usage error)
+        args.text = args.regex
     
     if not pattern or not args.text:
         parser.error("Provide regex and text, or use --pattern with text")
@@ -91,6 +106,9 @@ def main():
     if args.multiline:
         flags |= re.MULTILINE
     
+    if args.pattern and not flags:
+        pattern = _COMMON_COMPILED[args.pattern]
+    
     test_regex(pattern, args.text, flags, args.groups, args.all)
 
 if __name__ == "__main__":
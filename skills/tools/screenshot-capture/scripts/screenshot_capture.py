@@ -2,6 +2,7 @@
 """
 Screenshot Capture Tool
 Based on: https://github.com/python-pillow/Pillow
+Uses mss for faster capture when installed (pip install mss).
 
 Usage:
     python screenshot_capture.py --output screen.png
@@ -14,29 +15,60 @@ import time
 from datetime import datetime
 from pathlib import Path
 
-def capture_screenshot(output=None, region=None, delay=0):
-    """Capture screenshot."""
+SAVE_OPTIONS = {
+    # Fast Deflate: capture output is usually re-encoded or discarded anyway
+    'png': {'format': 'PNG', 'compress_level': 1},
+    'jpg': {'format': 'JPEG', 'quality': 90},
+    # Uncompressed, skips Deflate entirely
+    'bmp': {'format': 'BMP'},
+}
+
+def grab_screen(region=None):
+    """Grab the screen via mss when available, falling back to ImageGrab."""
     try:
-        from PIL import ImageGrab
+        from PIL import Image
     except ImportError:
         print("Error: Pillow required. Install: pip install Pillow", file=sys.stderr)
         sys.exit(1)
+    try:
+        import mss
+    except ImportError:
+        from PIL import ImageGrab
+        return ImageGrab.grab(bbox=region)
     
+    with mss.mss() as sct:
+        if region:
+            x1, y1, x2, y2 = region
+            monitor = {'left': x1, 'top': y1, 'width': x2 - x1, 'height': y2 - y1}
+        else:
+            # monitors[0] is the virtual screen spanning every display;
+            # ImageGrab.grab() captures the primary screen, which is monitors[1]
+            monitor = sct.monitors[1]
+        raw = sct.grab(monitor)
+        return Image.frombytes('RGB', raw.size, raw.rgb)
+
+def capture_screenshot(output=None, region=None, delay=0, format='png'):
+    """Capture screenshot."""
     if delay > 0:
         print(f"Capturing in {delay} seconds...")
         time.sleep(delay)
     
-    if region:
-        x1, y1, x2, y2 = region
-        screenshot = ImageGrab.grab(bbox=(x1, y1, x2, y2))
-    else:
-        screenshot = ImageGrab.grab()
+    screenshot = grab_screen(region)
     
     if not output:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output = f"screenshot_{timestamp}.png"
+        output = f"screenshot_{timestamp}.{format}"
     
-    screenshot.save(output)
+    ext = Path(output).suffix.lower().lstrip('.')
+    if ext == 'jpeg':
+        ext = 'jpg'
+    if ext in SAVE_OPTIONS:
+        screenshot.save(output, **SAVE_OPTIONS[ext])
+    elif not ext:
+        screenshot.save(output, **SAVE_OPTIONS[format])
+    else:
+        # Other extensions (.webp, .tiff, ...) keep Pillow's own format detection and defaults
+        screenshot.save(output)
     print(f"✓ Screenshot saved: {output} ({screenshot.size[0]}x{screenshot.size[1]})")
     return output
 
@@ -54,7 +86,7 @@ def main():
         if len(region) != 4:
             parser.error("Region must be x1,y1,x2,y2")
     
-    capture_screenshot(args.output, region, args.delay)
+    capture_screenshot(args.output, region, args.delay, args.format)
 
 if __name__ == "__main__":
     main()
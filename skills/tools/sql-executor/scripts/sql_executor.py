@@ -16,43 +16,86 @@ import sqlite3
 import sys
 from pathlib import Path
 
+READ_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+def is_select(query):
+    """Check whether a query is a read-only SELECT."""
+    return query.strip().upper().startswith('SELECT')
+
+EXPORT_FORMATS = ('.csv', '.json')
+
+def json_array_item(row):
+    """Format a row as an element of an indent=2 JSON array."""
+    return json.dumps(dict(row), indent=2, ensure_ascii=False).replace('\n', '\n  ')
+
 def execute_query(db_path, query, output=None, format='table'):
     """Execute SQL query and display/export results."""
+    if output and Path(output).suffix.lower() not in EXPORT_FORMATS:
+        print(f"Error: Unsupported output format: {output} (use .csv or .json)", file=sys.stderr)
+        sys.exit(1)
     try:
         conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute(query)
+        if output and Path(output).suffix.lower() == '.json':
+            # Named access is only needed to build JSON objects
+            conn.row_factory = sqlite3.Row
+        select = is_select(query)
+        if select:
+            # Read-only tuning: mmap I/O, 64MB page cache, in-memory temp tables
+            for pragma in READ_PRAGMAS:
+                conn.execute(pragma)
+        cursor = conn.execute(query)
         
-        if query.strip().upper().startswith('SELECT'):
-            rows = cursor.fetchall()
-            if not rows:
+        if select:
+            # Iterate the cursor lazily instead of materializing every row
+            cursor.arraysize = 1000
+            first = cursor.fetchone()
+            if first is None:
                 print("No results found.")
                 return
             
             columns = [desc[0] for desc in cursor.description]
-            data = [dict(row) for row in rows]
             
             if output:
+                count = 0
                 ext = Path(output).suffix.lower()
                 if ext == '.csv':
                     with open(output, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=columns)
-                        writer.writeheader()
-                        writer.writerows(data)
-                elif ext == '.json':
+                        writer = csv.writer(f)
+                        writer.writerow(columns)
+                        writer.writerow(first)
+                        count = 1
+                        for row in cursor:
+                            writer.writerow(row)
+                            count += 1
+                else:
+                    # Same layout as json.dump(rows, indent=2), written one row at a time
                     with open(output, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
-                print(f"✓ Exported {len(data)} rows to {output}")
+                        f.write('[\n  ')
+                        f.write(json_array_item(first))
+                        count = 1
+                        for row in cursor:
+                            f.write(',\n  ')
+                            f.write(json_array_item(row))
+                            count += 1
+                        f.write('\n]')
+                print(f"✓ Exported {count} rows to {output}")
             else:
                 # Print as table
                 print(' | '.join(columns))
                 print('-' * 60)
-                for row in data[:50]:
-                    print(' | '.join(str(row.get(c, ''))[:20] for c in columns))
-                if len(data) > 50:
-                    print(f"... and {len(data) - 50} more rows")
-                print(f"\n✓ {len(data)} rows returned")
+                fmt = ' | '.join(['{!s:.20}'] * len(columns))
+                rows = [first] + cursor.fetchmany(49)
+                for row in rows:
+                    print(fmt.format(*row))
+                count = len(rows) + sum(1 for _ in cursor)
+                if count > 50:
+                    print(f"... and {count - 50} more rows")
+                print(f"\n✓ {count} rows returned")
         else:
             conn.commit()
             print(f"✓ Query executed. Rows affected: {cursor.rowcount}")
@@ -62,6 +105,18 @@ def execute_query(db_path, query, output=None, format='table'):
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
+def execute_script(db_path, script):
+    """Execute multiple SQL statements in a single call."""
+    try:
+        conn = sqlite3.connect(db_path)
+        conn.executescript(script)
+        conn.commit()
+        print(f"✓ Script executed. Total changes: {conn.total_changes}")
+        conn.close()
+    except sqlite3.Error as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
 def main():
     parser = argparse.ArgumentParser(description="Execute SQL queries")
     parser.add_argument('database', help='SQLite database file')
@@ -73,6 +128,9 @@ def main():
     if args.file:
         with open(args.file, 'r') as f:
             query = f.read()
+        if not is_select(query):
+            execute_script(args.database, query)
+            return
     elif args.query:
         query = args.query
     else:
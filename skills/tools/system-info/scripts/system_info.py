@@ -13,14 +13,54 @@ import argparse
 import os
 import platform
 import sys
+import threading
+import time
+
+# Sampling window for CPU usage; long enough for a stable reading, short enough to feel instant
+CPU_SAMPLE_INTERVAL = 0.1
+
+# Seconds to wait for disk_usage calls before skipping slow mounts
+DISK_USAGE_TIMEOUT = 5
+
+_psutil = None
+
+def get_psutil():
+    """Import psutil once, returning None if it is not installed."""
+    global _psutil
+    if _psutil is None:
+        try:
+            import psutil
+            _psutil = psutil
+        except ImportError:
+            _psutil = False
+    return _psutil or None
+
+def read_proc_stat():
+    """Return (idle, total) CPU jiffies from /proc/stat."""
+    with open('/proc/stat') as f:
+        fields = [int(x) for x in f.readline().split()[1:]]
+    # idle + iowait
+    return fields[3] + fields[4], sum(fields)
+
+def proc_stat_cpu_percent(interval=CPU_SAMPLE_INTERVAL):
+    """Compute CPU usage from two /proc/stat samples (Linux only)."""
+    idle1, total1 = read_proc_stat()
+    time.sleep(interval)
+    idle2, total2 = read_proc_stat()
+    total_delta = total2 - total1
+    if total_delta <= 0:
+        return 0.0
+    return round((1 - (idle2 - idle1) / total_delta) * 100, 1)
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 def format_bytes(bytes_val):
     """Format bytes to human readable."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_val < 1024:
-            return f"{bytes_val:.1f} {unit}"
-        bytes_val /= 1024
-    return f"{bytes_val:.1f} PB"
+    if bytes_val < 1024:
+        return f"{bytes_val:.1f} B"
+    # Unit index straight from the bit length instead of a divide loop
+    idx = min((int(bytes_val).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{bytes_val / (1 << (10 * idx)):.1f} {_UNITS[idx]}"
 
 def get_basic_info():
     """Get basic system info without psutil."""
@@ -36,52 +76,70 @@ def get_basic_info():
 
 def get_cpu_info():
     """Get CPU information."""
-    try:
-        import psutil
-        return {
-            'cores_physical': psutil.cpu_count(logical=False),
-            'cores_logical': psutil.cpu_count(logical=True),
-            'usage_percent': psutil.cpu_percent(interval=1),
-            'freq': psutil.cpu_freq()
-        }
-    except ImportError:
-        return {'cores': os.cpu_count()}
+    psutil = get_psutil()
+    if psutil is None:
+        info = {'cores': os.cpu_count()}
+        if os.path.exists('/proc/stat'):
+            info['usage_percent'] = proc_stat_cpu_percent()
+        return info
+    return {
+        'cores_physical': psutil.cpu_count(logical=False),
+        'cores_logical': psutil.cpu_count(logical=True),
+        'usage_percent': psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL),
+        'freq': psutil.cpu_freq()
+    }
 
 def get_memory_info():
     """Get memory information."""
-    try:
-        import psutil
-        mem = psutil.virtual_memory()
-        return {
-            'total': format_bytes(mem.total),
-            'available': format_bytes(mem.available),
-            'used': format_bytes(mem.used),
-            'percent': mem.percent
-        }
-    except ImportError:
+    psutil = get_psutil()
+    if psutil is None:
         return None
+    mem = psutil.virtual_memory()
+    return {
+        'total': format_bytes(mem.total),
+        'available': format_bytes(mem.available),
+        'used': format_bytes(mem.used),
+        'percent': mem.percent
+    }
 
 def get_disk_info():
     """Get disk information."""
-    try:
-        import psutil
-        partitions = []
-        for part in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(part.mountpoint)
-                partitions.append({
-                    'device': part.device,
-                    'mountpoint': part.mountpoint,
-                    'total': format_bytes(usage.total),
-                    'used': format_bytes(usage.used),
-                    'free': format_bytes(usage.free),
-                    'percent': usage.percent
-                })
-            except:
-                pass
-        return partitions
-    except ImportError:
+    psutil = get_psutil()
+    if psutil is None:
         return None
+    parts = psutil.disk_partitions()
+    usages = {}
+    
+    def query(i, mountpoint):
+        try:
+            usages[i] = psutil.disk_usage(mountpoint)
+        except Exception:
+            pass
+    
+    # statvfs can block on network mounts, so query all mounts concurrently.
+    # Daemon threads let the tool exit even if a mount never answers.
+    threads = [threading.Thread(target=query, args=(i, p.mountpoint), daemon=True)
+               for i, p in enumerate(parts)]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + DISK_USAGE_TIMEOUT
+    for t in threads:
+        t.join(max(0, deadline - time.monotonic()))
+    
+    partitions = []
+    for i, part in enumerate(parts):
+        usage = usages.get(i)
+        if usage is None:
+            continue
+        partitions.append({
+            'device': part.device,
+            'mountpoint': part.mountpoint,
+            'total': format_bytes(usage.total),
+            'used': format_bytes(usage.used),
+            'free': format_bytes(usage.free),
+            'percent': usage.percent
+        })
+    return partitions
 
 def main():
     parser = argparse.ArgumentParser(description="System information")
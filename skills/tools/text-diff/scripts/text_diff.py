@@ -10,37 +10,57 @@ Usage:
 
 import argparse
 import difflib
+import filecmp
+import os
 import sys
 from pathlib import Path
 
+# Above this size, the default ndiff output (quadratic) is replaced by a unified diff
+LARGE_FILE_BYTES = 1024 * 1024
+
 def read_file(filepath):
-    """Read file and return lines."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return f.readlines()
+    """Read file lines as UTF-8 (BOM stripped), falling back to Latin-1 for other encodings.
+
+    Text mode keeps universal newlines, so CRLF and LF files compare equal.
+    """
+    try:
+        with open(filepath, 'r', encoding='utf-8-sig') as f:
+            return f.readlines()
+    except UnicodeDecodeError:
+        with open(filepath, 'r', encoding='latin-1') as f:
+            return f.readlines()
+
+def files_identical(file1, file2):
+    """Compare sizes first, then contents, without building line lists."""
+    if os.path.getsize(file1) != os.path.getsize(file2):
+        return False
+    return filecmp.cmp(file1, file2, shallow=False)
 
 def unified_diff(file1, file2, lines1, lines2, context=3):
-    """Generate unified diff."""
-    diff = difflib.unified_diff(
+    """Generate unified diff lines lazily."""
+    for line in difflib.unified_diff(
         lines1, lines2,
         fromfile=file1, tofile=file2,
-        lineterm=''
-    )
-    return '\n'.join(diff)
+        n=context
+    ):
+        yield line if line.endswith('\n') else line + '\n'
 
-def context_diff(file1, file2, lines1, lines2, context=3):
-    """Generate context diff."""
-    diff = difflib.context_diff(
-        lines1, lines2,
-        fromfile=file1, tofile=file2,
-        lineterm=''
-    )
-    return '\n'.join(diff)
 
 def html_diff(file1, file2, lines1, lines2):
     """Generate HTML diff."""
     differ = difflib.HtmlDiff()
     return differ.make_file(lines1, lines2, file1, file2)
 
+def simple_diff(file1, file2, lines1, lines2):
+    """Generate ndiff-style lines."""
+    for line in difflib.ndiff(lines1, lines2):
+        yield line if line.endswith('\n') else line + '\n'
+
+def write_diff(lines, out):
+    """Write diff lines to a stream as they are produced."""
+    for line in lines:
+        out.write(line)
+
 def main():
     parser = argparse.ArgumentParser(description="Compare files")
     parser.add_argument('file1', help='First file')
@@ -52,29 +72,40 @@ def main():
     parser.add_argument('--patch', '-p', action='store_true', help='Patch format')
     args = parser.parse_args()
     
+    if files_identical(args.file1, args.file2):
+        print("✓ Files are identical")
+        return
+    
     lines1 = read_file(args.file1)
     lines2 = read_file(args.file2)
     
+    # Byte-level differences may be line endings or a BOM only
     if lines1 == lines2:
         print("✓ Files are identical")
         return
     
+    # ndiff is quadratic, so large files always get a unified diff
+    large = max(os.path.getsize(args.file1), os.path.getsize(args.file2)) > LARGE_FILE_BYTES
+    
     if args.html:
-        result = html_diff(args.file1, args.file2, lines1, lines2)
-    elif args.unified or args.patch:
-        result = unified_diff(args.file1, args.file2, lines1, lines2, args.context)
+        diff = [html_diff(args.file1, args.file2,
+                          lines1, lines2)]
+    elif args.unified or args.patch or large:
+        if large and not (args.unified or args.patch):
+            print(f"Note: files over {LARGE_FILE_BYTES // (1024 * 1024)} MB are shown as a unified diff",
+                  file=sys.stderr)
+        diff = unified_diff(args.file1, args.file2,
+                            lines1, lines2, args.context)
     else:
-        # Simple diff
-        differ = difflib.Differ()
-        diff = differ.compare(lines1, lines2)
-        result = ''.join(diff)
+        diff = simple_diff(args.file1, args.file2,
+                           lines1, lines2)
     
     if args.output:
         with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(result)
+            write_diff(diff, f)
         print(f"✓ Diff saved to {args.output}")
     else:
-        print(result)
+        write_diff(diff, sys.stdout)
 
 if __name__ == "__main__":
     main()
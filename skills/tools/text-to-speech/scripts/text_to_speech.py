@@ -12,45 +12,59 @@ import argparse
 import sys
 from pathlib import Path
 
+_engine = None
+_engine_props = {}
+
+def get_engine():
+    """Get the shared pyttsx3 engine, initializing the driver once."""
+    global _engine
+    if _engine is None:
+        try:
+            import pyttsx3
+        except ImportError:
+            print("Error: pyttsx3 required. Install: pip install pyttsx3", file=sys.stderr)
+            sys.exit(1)
+        _engine = pyttsx3.init()
+    return _engine
+
+def set_property(engine, name, value):
+    """Set an engine property only if it differs from the last value set."""
+    if _engine_props.get(name) != value:
+        engine.setProperty(name, value)
+        _engine_props[name] = value
+
 def text_to_speech(text, output=None, rate=150, voice_id=0, volume=1.0):
     """Convert text to speech."""
-    try:
-        import pyttsx3
-    except ImportError:
-        print("Error: pyttsx3 required. Install: pip install pyttsx3", file=sys.stderr)
-        sys.exit(1)
-    
-    engine = pyttsx3.init()
+    engine = get_engine()
     
     # Set properties
-    engine.setProperty('rate', rate)
-    engine.setProperty('volume', volume)
+    set_property(engine, 'rate', rate)
+    set_property(engine, 'volume', volume)
     
     # Set voice
     voices = engine.getProperty('voices')
     if voice_id < len(voices):
-        engine.setProperty('voice', voices[voice_id].id)
+        set_property(engine, 'voice', voices[voice_id].id)
     
     if output:
         engine.save_to_file(text, output)
         engine.runAndWait()
         print(f"✓ Audio saved to {output}")
     else:
-        engine.say(text)
+        # Queue paragraphs so the driver can start speaking before all text is processed
+        for paragraph in text.split('\n\n'):
+            if paragraph.strip():
+                engine.say(paragraph)
         engine.runAndWait()
         print("✓ Speech completed")
 
 def list_voices():
     """List available voices."""
-    try:
-        import pyttsx3
-        engine = pyttsx3.init()
-        voices = engine.getProperty('voices')
-        print("Available voices:")
-        for i, voice in enumerate(voices):
-            print(f"  {i}: {voice.name} ({voice.languages})")
-    except ImportError:
-        print("Error: pyttsx3 required", file=sys.stderr)
+    engine = get_engine()
+    voices = engine.getProperty('voices')
+    print("Available voices:")
+    for i, voice in enumerate(voices):
+        print(f"  {i}: {voice.name} ({voice.languages})")
 
 def main():
     parser = argparse.ArgumentParser(description="Text to speech")
@@ -16,6 +16,7 @@ Requirements:
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -149,18 +150,46 @@ def translate_file(filepath: str, dest: str, src: str = 'auto',
     return output
 
 
-def translate_json(data, translator, dest: str, src: str = 'auto'):
-    """Recursively translate JSON string values."""
+def translate_json(data, translator, dest: str, src: str = 'auto',
+                   max_workers: int = 16):
+    """Translate JSON string values, dispatching requests concurrently."""
+    strings = []
+    _collect_strings(data, strings)
+    
+    def translate_one(text):
+        try:
+            return translator.translate(text, dest=dest, src=src).text
+        except:
+            return text
+    
+    # Each leaf is a blocking HTTP round-trip; identical strings are sent once
+    unique = list(dict.fromkeys(strings))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        translated = dict(zip(unique, executor.map(translate_one, unique)))
+    
+    return _replace_strings(data, translated)
+
+
+def _collect_strings(data, out: list):
+    """Collect non-blank string values from a JSON tree."""
     if isinstance(data, dict):
-        return {k: translate_json(v, translator, dest, src) for k, v in data.items()}
+        for v in data.values():
+            _collect_strings(v, out)
     elif isinstance(data, list):
-        return [translate_json(item, translator, dest, src) for item in data]
+        for item in data:
+            _collect_strings(item, out)
     elif isinstance(data, str) and data.strip():
-        try:
-            result = translator.translate(data, dest=dest, src=src)
-            return result.text
-        except:
-            return data
+        out.append(data)
+
+
+def _replace_strings(data, translated: dict):
+    """Rebuild a JSON tree with string values looked up in translated."""
+    if isinstance(data, dict):
+        return {k: _replace_strings(v, translated) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_replace_strings(item, translated) for item in data]
+    elif isinstance(data, str):
+        return translated.get(data, data)
     return data
 
 
@@ -5,6 +5,7 @@ Based on: https://github.com/ellisonleao/pyshorteners
 
 Usage:
     python url_shortener.py "https://example.com/long/path"
+    python url_shortener.py example.com/a example.com/b --service isgd
 """
 
 import argparse
@@ -12,13 +13,46 @@ import hashlib
 import sys
 import urllib.request
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+_session = None
+
+def get_session():
+    """Get a shared keep-alive session, or None if requests is unavailable."""
+    global _session
+    if _session is None and requests is not None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+    return _session
+
+def fetch_text(api_url):
+    """Fetch an API URL and return the stripped response body."""
+    session = get_session()
+    if session is not None:
+        response = session.get(api_url, timeout=10)
+        response.raise_for_status()
+        return response.text.strip()
+    with urllib.request.urlopen(api_url, timeout=10) as response:
+        return response.read().decode('utf-8').strip()
 
 def shorten_tinyurl(url):
     """Shorten URL using TinyURL."""
     api_url = f"http://tinyurl.com/api-create.php?url={urllib.parse.quote(url)}"
     try:
-        with urllib.request.urlopen(api_url, timeout=10) as response:
-            return response.read().decode('utf-8')
+        return fetch_text(api_url)
     except Exception as e:
         return None
 
@@ -26,15 +60,18 @@ def shorten_isgd(url):
     """Shorten URL using is.gd."""
     api_url = f"https://is.gd/create.php?format=simple&url={urllib.parse.quote(url)}"
     try:
-        with urllib.request.urlopen(api_url, timeout=10) as response:
-            return response.read().decode('utf-8')
+        return fetch_text(api_url)
     except Exception as e:
         return None
 
 def generate_local_short(url):
-    """Generate a local short hash."""
-    hash_obj = hashlib.md5(url.encode())
-    return f"local:{hash_obj.hexdigest()[:8]}"
+    """Generate a local short hash.
+
+    Always SHA-256 (hardware-accelerated by OpenSSL where available), so the
+    same URL gets the same code on every machine. Only 32 bits of the digest
+    are kept, so collisions become likely after tens of thousands of URLs.
+    """
+    return f"local:{hashlib.sha256(url.encode()).hexdigest()[:8]}"
 
 SERVICES = {
     'tinyurl': shorten_tinyurl,
@@ -42,39 +79,54 @@ SERVICES = {
     'local': generate_local_short
 }
 
+def shorten_batch(urls, service='tinyurl', max_workers=8):
+    """Shorten many URLs concurrently, preserving input order."""
+    shortener = SERVICES[service]
+    if service == 'local' or len(urls) <= 1:
+        return [shortener(url) for url in urls]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(shortener, urls))
+
 def main():
     parser = argparse.ArgumentParser(description="Shorten URLs")
-    parser.add_argument('url', help='URL to shorten')
+    parser.add_argument('urls', nargs='+', metavar='url', help='URL(s) to shorten')
     parser.add_argument('--service', '-s', default='tinyurl', 
                        choices=list(SERVICES.keys()))
     parser.add_argument('--qr', action='store_true', help='Generate QR code')
-    parser.add_argument('--output', '-o', help='QR code output file')
+    parser.add_argument('--output', '-o',
+                       help='QR code output file (numbered, e.g. qr_code_1.png, for several URLs)')
     args = parser.parse_args()
     
-    # Validate URL
-    if not args.url.startswith(('http://', 'https://')):
-        args.url = 'https://' + args.url
+    # Validate URLs
+    urls = [u if u.startswith(('http://', 'https://')) else 'https://' + u
+            for u in args.urls]
     
     # Shorten
-    shortener = SERVICES.get(args.service)
-    short_url = shortener(args.url)
+    results = shorten_batch(urls, args.service)
     
-    if not short_url:
-        print(f"Error: Failed to shorten URL", file=sys.stderr)
-        sys.exit(1)
+    failed = False
+    for url, short_url in zip(urls, results):
+        if not short_url:
+            print(f"Error: Failed to shorten URL: {url}", file=sys.stderr)
+            failed = True
+            continue
+        print(f"Original: {url}")
+        print(f"Shortened: {short_url}")
     
-    print(f"Original: {args.url}")
-    print(f"Shortened: {short_url}")
+    if failed:
+        sys.exit(1)
     
     if args.qr:
         try:
             import qrcode
-            qr = qrcode.make(short_url)
-            output = args.output or 'qr_code.png'
-            qr.save(output)
-            print(f"QR Code: {output}")
         except ImportError:
             print("Note: Install qrcode for QR generation: pip install qrcode")
+            return
+        output = Path(args.output or 'qr_code.png')
+        for i, short_url in enumerate(results, 1):
+            path = output if len(results) == 1 else output.with_name(f"{output.stem}_{i}{output.suffix}")
+            qrcode.make(short_url).save(path)
+            print(f"QR Code: {path}")
 
 if __name__ == "__main__":
     main()
@@ -10,11 +10,16 @@ Usage:
 """
 
 import argparse
+import os
 import secrets
 import string
+import sys
 import time
 import uuid
 
+# Above this count, v4 UUIDs are cut from one os.urandom draw
+BULK_V4_THRESHOLD = 32
+
 NAMESPACES = {
     'dns': uuid.NAMESPACE_DNS,
     'url': uuid.NAMESPACE_URL,
@@ -28,6 +33,16 @@ def generate_uuid_v1():
 def generate_uuid_v4():
     return str(uuid.uuid4())
 
+def generate_uuid_v4_bulk(count):
+    """Generate many v4 UUIDs from a single os.urandom call."""
+    buf = bytearray(os.urandom(16 * count))
+    result = []
+    for i in range(0, len(buf), 16):
+        buf[i + 6] = (buf[i + 6] & 0x0f) | 0x40  # version 4
+        buf[i + 8] = (buf[i + 8] & 0x3f) | 0x80  # RFC 4122 variant
+        result.append(str(uuid.UUID(bytes=bytes(buf[i:i + 16]))))
+    return result
+
 def generate_uuid_v5(namespace, name):
     ns = NAMESPACES.get(namespace, uuid.NAMESPACE_DNS)
     return str(uuid.uuid5(ns, name))
@@ -57,6 +72,12 @@ def main():
     parser.add_argument('--upper', '-u', action='store_true', help='Uppercase output')
     args = parser.parse_args()
     
+    if (args.count > BULK_V4_THRESHOLD
+            and not (args.v1 or args.v5 or args.short or args.ulid)):
+        output = '\n'.join(generate_uuid_v4_bulk(args.count))
+        sys.stdout.write((output.upper() if args.upper else output) + '\n')
+        return
+    
     for _ in range(args.count):
         if args.v1:
             result = generate_uuid_v1()
@@ -8,60 +8,494 @@ Usage:
     python web_scraper.py --url "https://example.com" --selector ".item" --output data.json
     python web_scraper.py --url "https://example.com" --selectors "title:h1,price:.price,link:a@href"
     python web_scraper.py --urls urls.txt --selector ".product" --delay 2
+    python web_scraper.py --urls urls.txt --selector ".product" --concurrency 8
 
 Requirements:
-    pip install requests beautifulsoup4 lxml
+    pip install requests beautifulsoup4 lxml cssselect
+    pip install brotli  # optional, enables Brotli-compressed responses
 """
 
 import argparse
+import asyncio
+import functools
 import json
+import os
 import re
 import sys
+import threading
 import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 
 try:
     import requests
     from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: Required packages missing. Install: pip install requests beautifulsoup4 lxml", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+try:
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from cssselect import HTMLTranslator, SelectorError
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+except ImportError:
+    LexborHTMLParser = None
+
+PARSERS = ['lxml', 'selectolax', 'bs4']
+DEFAULT_PARSER = 'lxml' if lxml_html is not None else 'bs4'
+
+
+def _accept_encoding() -> str:
+    """Advertise Brotli only when a decoder is installed for requests/aiohttp/httpx."""
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+            return 'br, gzip, deflate'
+        except ImportError:
+            pass
+    return 'gzip, deflate'
+
 
 # Default headers to avoid blocking
 DEFAULT_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': _accept_encoding(),
 }
 
 
-def fetch_page(url: str, headers: dict = None, timeout: int = 30) -> str | None:
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'web-scraper'
+CACHE_EXPIRE_AFTER = timedelta(hours=1)
+
+
+def create_session(cache_dir: str | Path | None = None) -> requests.Session:
+    """
+    Create a pooled HTTP session with keep-alive and retries.
+    
+    Reusing one session lets urllib3 keep connections open, so repeated
+    requests to the same host skip the TCP/TLS handshake.
+    
+    Args:
+        cache_dir: If set and requests-cache is installed, responses are cached
+            on disk and revalidated with ETag/Last-Modified on later runs
+    """
+    if cache_dir is not None and CachedSession is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        session = CachedSession(
+            str(Path(cache_dir) / 'scrape_cache.sqlite'),
+            backend='sqlite',
+            cache_control=True,
+            expire_after=CACHE_EXPIRE_AFTER,
+            stale_if_error=True,
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = create_session()
+
+# Pages larger than this are abandoned rather than downloaded in full
+MAX_PAGE_BYTES = 10 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+def dumps_json(data, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _decode_body(buf: bytes | bytearray, charset: str | None) -> str:
+    """Decode a response body, falling back to UTF-8 for unknown charsets."""
+    try:
+        return buf.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        return buf.decode('utf-8', errors='replace')
+
+
+def check_response_headers(content_type: str, content_length: str | int | None) -> str | None:
+    """Return a reason to skip a response based on its headers, or None if it looks like HTML."""
+    if content_type and 'html' not in content_type and 'xml' not in content_type:
+        return f"unsupported content type {content_type}"
+    if content_length and str(content_length).isdigit() and int(content_length) > MAX_PAGE_BYTES:
+        return f"content length {content_length} exceeds {MAX_PAGE_BYTES} bytes"
+    return None
+
+
+def _conditional_headers(url: str, headers: dict | None, last_modified: dict | None) -> dict | None:
+    """Add If-Modified-Since for URLs with a recorded Last-Modified value."""
+    if last_modified is not None and url in last_modified:
+        return {**(headers or {}), 'If-Modified-Since': last_modified[url]}
+    return headers
+
+
+def _note_not_modified(url: str, not_modified: set | None):
+    print(f"Not modified: {url}", file=sys.stderr)
+    if not_modified is not None:
+        not_modified.add(url)
+
+
+def _record_last_modified(url: str, value: str | None, last_modified: dict | None):
+    """Remember Last-Modified, only once a page is actually handed over for parsing."""
+    if last_modified is not None and value:
+        last_modified[url] = value
+
+
+def fetch_page(
+    url: str,
+    headers: dict = None,
+    timeout: int = 30,
+    session: requests.Session = None,
+    last_modified: dict = None,
+    not_modified: set = None,
+) -> str | None:
     """
     Fetch HTML content from URL.
     
     Args:
         url: URL to fetch
-        headers: Custom headers
+        headers: Custom headers (merged over the session defaults)
         timeout: Request timeout in seconds
+        session: Session to use (defaults to the shared module session)
+        last_modified: Optional {url: Last-Modified} map; sent as
+            If-Modified-Since and updated when an HTML body is returned
+        not_modified: Optional set collecting URLs answered with 304
     
     Returns:
-        HTML content or None on error
+        HTML content, or None on error, when not modified, or for
+        non-HTML/oversized responses
     """
+    headers = _conditional_headers(url, headers, last_modified)
+    
     try:
-        response = requests.get(
+        with (session or _SESSION).get(
             url,
-            headers=headers or DEFAULT_HEADERS,
+            headers=headers,
             timeout=timeout,
-        )
-        response.raise_for_status()
-        return response.text
+            stream=True,
+        ) as response:
+            if response.status_code == 304:
+                _note_not_modified(url, not_modified)
+                return None
+            response.raise_for_status()
+            reason = check_response_headers(
+                response.headers.get('Content-Type', ''),
+                response.headers.get('Content-Length'),
+            )
+            if reason:
+                print(f"Skipping {url}: {reason}", file=sys.stderr)
+                return None
+            
+            buf = bytearray()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                buf.extend(chunk)
+                if len(buf) > MAX_PAGE_BYTES:
+                    print(f"Skipping {url}: body exceeds {MAX_PAGE_BYTES} bytes", file=sys.stderr)
+                    return None
+            _record_last_modified(url, response.headers.get('Last-Modified'), last_modified)
+            return _decode_body(buf, response.encoding)
     except requests.RequestException as e:
         print(f"Error fetching {url}: {e}", file=sys.stderr)
         return None
 
 
+class HostRateLimiter:
+    """
+    Per-host politeness delay.
+    
+    Requests to the same host are spaced at least `delay` seconds apart,
+    while requests to different hosts are not throttled against each other.
+    """
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._host_delay: dict[str, float] = {}
+        self._next_ok: dict[str, float] = {}
+        self._locks = defaultdict(asyncio.Lock)
+    
+    def set_min_delay(self, host: str, delay: float):
+        """Raise the delay for one host (e.g. from a robots.txt Crawl-delay)."""
+        self._host_delay[host] = max(delay, self._host_delay.get(host, 0.0))
+    
+    def _delay_for(self, host: str) -> float:
+        return max(self.delay, self._host_delay.get(host, 0.0))
+    
+    def _reserve(self, host: str) -> float:
+        """Claim the next slot for host and return how long to wait for it."""
+        now = time.monotonic()
+        start = max(now, self._next_ok.get(host, 0.0))
+        self._next_ok[host] = start + self._delay_for(host)
+        return start - now
+    
+    def wait(self, url: str):
+        """Block until url's host may be requested again."""
+        host = urlparse(url).netloc
+        if self._delay_for(host) > 0:
+            remaining = self._reserve(host)
+            if remaining > 0:
+                time.sleep(remaining)
+    
+    async def wait_async(self, url: str):
+        """Async variant of wait(); other hosts proceed while this one sleeps."""
+        host = urlparse(url).netloc
+        if self._delay_for(host) > 0:
+            async with self._locks[host]:
+                remaining = self._reserve(host)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+
+
+@functools.lru_cache(maxsize=1024)
+def _robots_for(origin: str) -> RobotFileParser:
+    """Fetch and parse robots.txt for an origin (scheme://host), once per run."""
+    robots_url = f"{origin}/robots.txt"
+    parser = RobotFileParser(robots_url)
+    try:
+        response = _SESSION.get(robots_url, timeout=10)
+    except requests.RequestException:
+        parser.allow_all = True
+        return parser
+    # Same status handling as RobotFileParser.read()
+    if response.status_code in (401, 403):
+        parser.disallow_all = True
+    elif response.status_code >= 400:
+        parser.allow_all = True
+    else:
+        parser.parse(response.text.splitlines())
+    return parser
+
+
+def robots_allows(url: str, limiter: HostRateLimiter = None) -> bool:
+    """
+    Check robots.txt for url, applying any Crawl-delay to the limiter.
+    
+    Returns:
+        False if robots.txt disallows fetching url
+    """
+    parts = urlparse(url)
+    robots = _robots_for(f"{parts.scheme}://{parts.netloc}")
+    user_agent = DEFAULT_HEADERS['User-Agent']
+    crawl_delay = robots.crawl_delay(user_agent)
+    if crawl_delay and limiter:
+        limiter.set_min_delay(parts.netloc, float(crawl_delay))
+    if not robots.can_fetch(user_agent, url):
+        print(f"Skipping {url}: disallowed by robots.txt", file=sys.stderr)
+        return False
+    return True
+
+
+async def _read_capped_async(url: str, chunks) -> bytearray | None:
+    """Collect an async byte-chunk iterator, giving up past MAX_PAGE_BYTES."""
+    buf = bytearray()
+    async for chunk in chunks:
+        buf.extend(chunk)
+        if len(buf) > MAX_PAGE_BYTES:
+            print(f"Skipping {url}: body exceeds {MAX_PAGE_BYTES} bytes", file=sys.stderr)
+            return None
+    return buf
+
+
+async def _fetch_async(
+    session,
+    url: str,
+    sem: asyncio.Semaphore,
+    timeout: int,
+    limiter: HostRateLimiter = None,
+    last_modified: dict = None,
+    not_modified: set = None,
+) -> str | None:
+    """Fetch one URL on an aiohttp session, bounded by the semaphore."""
+    if limiter:
+        await limiter.wait_async(url)
+    async with sem:
+        try:
+            async with session.get(
+                url,
+                headers=_conditional_headers(url, None, last_modified),
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                if response.status == 304:
+                    _note_not_modified(url, not_modified)
+                    return None
+                response.raise_for_status()
+                reason = check_response_headers(
+                    response.headers.get('Content-Type', ''),
+                    response.content_length,
+                )
+                if reason:
+                    print(f"Skipping {url}: {reason}", file=sys.stderr)
+                    return None
+                
+                buf = await _read_capped_async(url, response.content.iter_chunked(CHUNK_SIZE))
+                if buf is None:
+                    return None
+                _record_last_modified(url, response.headers.get('Last-Modified'), last_modified)
+                return _decode_body(buf, response.charset)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching {url}: {e}", file=sys.stderr)
+            return None
+
+
+async def _fetch_async_httpx(
+    client,
+    url: str,
+    sem: asyncio.Semaphore,
+    limiter: HostRateLimiter = None,
+    last_modified: dict = None,
+    not_modified: set = None,
+) -> str | None:
+    """Fetch one URL on an httpx client (HTTP/2 capable), bounded by the semaphore."""
+    if limiter:
+        await limiter.wait_async(url)
+    async with sem:
+        try:
+            async with client.stream('GET', url, headers=_conditional_headers(url, None, last_modified)) as response:
+                if response.status_code == 304:
+                    _note_not_modified(url, not_modified)
+                    return None
+                response.raise_for_status()
+                reason = check_response_headers(
+                    response.headers.get('Content-Type', ''),
+                    response.headers.get('Content-Length'),
+                )
+                if reason:
+                    print(f"Skipping {url}: {reason}", file=sys.stderr)
+                    return None
+                
+                buf = await _read_capped_async(url, response.aiter_bytes(CHUNK_SIZE))
+                if buf is None:
+                    return None
+                _record_last_modified(url, response.headers.get('Last-Modified'), last_modified)
+                return _decode_body(buf, response.charset_encoding)
+        except httpx.HTTPError as e:
+            print(f"Error fetching {url}: {e}", file=sys.stderr)
+            return None
+
+
+def _create_resolver():
+    """
+    Use aiodns for non-blocking DNS when installed.
+    
+    The default resolver runs getaddrinfo on a thread pool, so many unique
+    hosts queue behind its workers.
+    """
+    try:
+        import aiodns  # noqa: F401
+        return aiohttp.AsyncResolver()
+    except ImportError:
+        return None
+
+
+async def fetch_pages_async(
+    urls: list[str],
+    concurrency: int = 8,
+    timeout: int = 30,
+    delay: float = 0,
+    http2: bool = False,
+    limiter: HostRateLimiter = None,
+    last_modified: dict = None,
+    not_modified: set = None,
+) -> list[str | None]:
+    """
+    Fetch many URLs concurrently over a shared connection pool.
+    
+    Args:
+        urls: URLs to fetch
+        concurrency: Maximum number of requests in flight
+        timeout: Per-request timeout in seconds
+        delay: Minimum seconds between requests to the same host
+        http2: Use httpx with HTTP/2 so same-host requests share one connection
+        limiter: Rate limiter to use instead of a fresh one built from delay
+        last_modified: Optional {url: Last-Modified} map, as for fetch_page
+        not_modified: Optional set collecting URLs answered with 304
+    
+    Returns:
+        HTML content (or None on error or when not modified) for each URL, in input order
+    """
+    sem = asyncio.Semaphore(concurrency)
+    limiter = limiter or HostRateLimiter(delay)
+    
+    if http2:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=limits,
+            timeout=timeout,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+        ) as client:
+            return await asyncio.gather(*[
+                _fetch_async_httpx(client, url, sem, limiter, last_modified, not_modified) for url in urls
+            ])
+    
+    # Pool sized to --concurrency; per-host politeness comes from the rate limiter
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        limit_per_host=concurrency,
+        keepalive_timeout=30,
+        resolver=_create_resolver(),
+        ttl_dns_cache=300,
+    )
+    async with aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS) as session:
+        return await asyncio.gather(*[
+            _fetch_async(session, url, sem, timeout, limiter, last_modified, not_modified) for url in urls
+        ])
+
+
+@functools.lru_cache(maxsize=256)
 def parse_selector(selector_str: str) -> tuple[str, str | None]:
     """
     Parse selector string with optional attribute.
@@ -72,9 +506,9 @@ def parse_selector(selector_str: str) -> tuple[str, str | None]:
     Returns:
         Tuple of (css_selector, attribute_name)
     """
-    if '@' in selector_str:
-        parts = selector_str.rsplit('@', 1)
-        return parts[0], parts[1]
+    css_sel, sep, attr = selector_str.rpartition('@')
+    if sep:
+        return css_sel, attr
     return selector_str, None
 
 
@@ -85,64 +519,149 @@ def extract_value(element, attribute: str = None) -> str:
     return element.get_text(strip=True)
 
 
-def scrape_page(
-    html: str,
-    selector: str = None,
-    selectors: dict = None,
-    base_url: str = None,
-) -> list[dict] | list[str]:
+if lxml_html is not None:
+    # Text nodes as BeautifulSoup's get_text() sees them (no comments, scripts or styles)
+    _TEXT_NODES = etree.XPath('.//text()[not(parent::script or parent::style or parent::template)]')
+
+
+# "tag", ".class", "#id", "tag.class" or "tag#id"
+_SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)?(?:([.#])([\w-]+))?$')
+
+
+def _iter_tag(tag: str, node) -> list:
+    """Descendants of node with the given tag, in document order."""
+    return list(node.iterdescendants(tag))
+
+
+def _iter_tag_or_self(tag: str, node) -> list:
+    """Like _iter_tag, but node itself is included when it matches."""
+    return list(node.iter(tag))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_css(css_sel: str, include_self: bool = False):
     """
-    Scrape data from HTML using CSS selectors.
+    Compile a CSS selector into a callable returning matching descendants.
     
-    Args:
-        html: HTML content
-        selector: Single CSS selector (returns list of strings)
-        selectors: Dict of {name: selector} for structured extraction
-        base_url: Base URL for resolving relative links
+    Trivial selectors skip the cssselect translator: bare tags walk the tree
+    directly and class/id selectors use a fixed XPath. Everything else is
+    translated by cssselect. Cached, since the same selectors are applied to
+    every page of a run.
     
-    Returns:
-        List of extracted data
+    With include_self the node passed in may match too. Document-level
+    selections are evaluated from the root <html> element and need this
+    to match the way soup.select() sees the document; selections inside a
+    container do not (select_one() never returns the container itself).
+    
+    Raises:
+        SelectorError: for selectors cssselect cannot translate (e.g.
+            soupsieve extensions such as :-soup-contains())
+    """
+    axis = 'descendant-or-self::' if include_self else 'descendant::'
+    match = _SIMPLE_SELECTOR.match(css_sel.strip())
+    if match and any(match.groups()):
+        tag, kind, name = match.groups()
+        tag = tag.lower() if tag else None
+        if not kind:
+            return functools.partial(_iter_tag_or_self if include_self else _iter_tag, tag)
+        if kind == '.':
+            xpath = etree.XPath(
+                f"{axis}{tag or '*'}[@class and "
+                "contains(concat(' ', normalize-space(@class), ' '), $cls)]"
+            )
+            return functools.partial(xpath, cls=f' {name} ')
+        xpath = etree.XPath(f"{axis}{tag or '*'}[@id = $id]")
+        return functools.partial(xpath, id=name)
+    return etree.XPath(HTMLTranslator().css_to_xpath(css_sel, prefix=axis))
+
+
+_parser_local = threading.local()
+
+
+def _lxml_parser():
+    """
+    Return this thread's reusable lxml HTML parser.
+    
+    Whitespace-only text never contributes to extracted values, so it is
+    dropped at parse time to keep the tree small. Comments are kept: removing
+    them would merge the text around them and change extracted values.
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = lxml_html.HTMLParser(remove_blank_text=True, recover=True)
+        _parser_local.parser = parser
+    return parser
+
+
+def _extract_value_lxml(element, attribute: str = None) -> str:
+    """Extract text or attribute value from an lxml element (bs4-compatible)."""
+    if attribute:
+        return element.get(attribute, '').strip()
+    return ''.join(t.strip() for t in _TEXT_NODES(element))
+
+
+def _extract_results(
+    document,
+    selector: str,
+    selectors: dict,
+    base_url: str,
+    source_url: str,
+    select_all,
+    select_first,
+    value_of,
+) -> list:
+    """
+    Backend-independent extraction loop shared by every parser.
+    
+    Args:
+        document: Parsed document; also the container when _container matches nothing
+        select_all: (node, css) -> all matches, the node itself included
+        select_first: (node, css) -> first match below node, or None
+        value_of: (element, attr) -> text, or the attribute value if attr is set
     """
-    soup = BeautifulSoup(html, 'lxml')
     results = []
     
     if selectors:
         # Multiple selectors - extract structured data
+        fields = [
+            (name, *parse_selector(sel_str))
+            for name, sel_str in selectors.items()
+            if not name.startswith('_')
+        ]
+        
         # Find container elements first
-        containers = soup.select(selectors.get('_container', 'body'))
+        containers = select_all(document, selectors.get('_container', 'body'))
         if not containers:
-            containers = [soup]
+            containers = [document]
         
         for container in containers:
             item = {}
-            for name, sel_str in selectors.items():
-                if name.startswith('_'):
-                    continue
-                
-                css_sel, attr = parse_selector(sel_str)
-                element = container.select_one(css_sel)
+            has_any = False
+            for name, css_sel, attr in fields:
+                element = select_first(container, css_sel)
                 
-                if element:
-                    value = extract_value(element, attr)
+                if element is not None:
+                    value = value_of(element, attr)
                     
                     # Resolve relative URLs
                     if attr in ['href', 'src'] and base_url and value:
                         value = urljoin(base_url, value)
                     
                     item[name] = value
+                    has_any = True
                 else:
                     item[name] = None
             
-            if any(v is not None for v in item.values()):
+            if has_any:
+                if source_url:
+                    item['_source_url'] = source_url
                 results.append(item)
     
     elif selector:
         # Single selector - extract list of values
         css_sel, attr = parse_selector(selector)
-        elements = soup.select(css_sel)
-        
-        for element in elements:
-            value = extract_value(element, attr)
+        for element in select_all(document, css_sel):
+            value = value_of(element, attr)
             
             if attr in ['href', 'src'] and base_url and value:
                 value = urljoin(base_url, value)
@@ -153,56 +672,358 @@ def scrape_page(
     return results
 
 
-def scrape_urls(
+def _scrape_page_lxml(html: str, selector: str, selectors: dict, base_url: str, source_url: str) -> list:
+    """lxml/XPath implementation of scrape_page."""
+    root = lxml_html.document_fromstring(html, parser=_lxml_parser())
+    
+    def select_all(node, css_sel):
+        return _compile_css(css_sel, True)(node)
+    
+    def select_first(node, css_sel):
+        # The <html> root stands in for the document, so it may match itself
+        matches = _compile_css(css_sel, node is root)(node)
+        return matches[0] if matches else None
+    
+    return _extract_results(root, selector, selectors, base_url, source_url,
+                            select_all, select_first, _extract_value_lxml)
+
+
+class _AttrCollector:
+    """lxml parser target collecting one attribute of one tag as tags open."""
+    
+    def __init__(self, tag: str, attr: str):
+        self.tag = tag
+        self.attr = attr
+        self.values = []
+    
+    def start(self, tag, attrib):
+        if tag == self.tag:
+            value = attrib.get(self.attr, '').strip()
+            if value:
+                self.values.append(value)
+    
+    def close(self):
+        return self.values
+
+
+@functools.lru_cache(maxsize=256)
+def _tag_attr_selector(selector: str) -> tuple[str, str] | None:
+    """Return (tag, attr) for bare 'tag@attr' selectors such as 'a@href', else None."""
+    css_sel, attr = parse_selector(selector)
+    if not attr:
+        return None
+    match = _SIMPLE_SELECTOR.match(css_sel.strip())
+    if not match or not match.group(1) or match.group(2):
+        return None
+    return match.group(1).lower(), attr
+
+
+def _scrape_attr_streaming(html: str, tag: str, attr: str, base_url: str) -> list[str]:
+    """
+    Collect tag@attr values via parser callbacks, without building a tree.
+    
+    Memory stays flat however large the page is, and skipping tree
+    construction is also faster than the DOM path for link/image dumps.
+    """
+    values = etree.fromstring(html, etree.HTMLParser(target=_AttrCollector(tag, attr)))
+    if attr in ['href', 'src'] and base_url:
+        return [urljoin(base_url, value) for value in values]
+    return values
+
+
+def _first_descendant(node, css_sel: str):
+    """Return the first match below node (lexbor's css() also matches node itself)."""
+    matches = node.css(css_sel)
+    # Matches are in document order, so only the first can be node itself;
+    # compare node pointers, since == serializes both subtrees
+    if matches and matches[0].mem_id == node.mem_id:
+        return matches[1] if len(matches) > 1 else None
+    return matches[0] if matches else None
+
+
+# Text under these is ignored, as BeautifulSoup's get_text() and _TEXT_NODES do
+_NON_TEXT_TAGS = frozenset({'script', 'style', 'template'})
+
+
+def _text_selectolax(element) -> str:
+    """bs4-compatible text of a selectolax node, without script/style/template text."""
+    if element.tag not in _NON_TEXT_TAGS and element.css_first('script, style, template') is None:
+        return element.text(strip=True)
+    return ''.join(
+        node.text_content.strip()
+        for node in element.traverse(include_text=True)
+        if node.is_text_node and node.parent.tag not in _NON_TEXT_TAGS
+    )
+
+
+def _scrape_page_selectolax(html: str, selector: str, selectors: dict, base_url: str, source_url: str) -> list:
+    """selectolax (lexbor) implementation of scrape_page."""
+    tree = LexborHTMLParser(html)
+    
+    def select_first(node, css_sel):
+        if node is tree:
+            return tree.css_first(css_sel)
+        return _first_descendant(node, css_sel)
+    
+    def extract(element, attr):
+        if attr:
+            return (element.attributes.get(attr) or '').strip()
+        return _text_selectolax(element)
+    
+    return _extract_results(tree, selector, selectors, base_url, source_url,
+                            lambda node, css_sel: node.css(css_sel), select_first, extract)
+
+
+def scrape_page(
+    html: str,
+    selector: str = None,
+    selectors: dict = None,
+    base_url: str = None,
+    parser: str = DEFAULT_PARSER,
+    source_url: str = None,
+) -> list[dict] | list[str]:
+    """
+    Scrape data from HTML using CSS selectors.
+    
+    Args:
+        html: HTML content
+        selector: Single CSS selector (returns list of strings)
+        selectors: Dict of {name: selector} for structured extraction
+        base_url: Base URL for resolving relative links
+        parser: 'lxml' (libxml2 + compiled XPath), 'selectolax' (lexbor)
+            or 'bs4' (BeautifulSoup)
+        source_url: If set, stored as '_source_url' on each structured item
+    
+    Returns:
+        List of extracted data
+    """
+    if parser == 'selectolax' and LexborHTMLParser is not None:
+        try:
+            return _scrape_page_selectolax(html, selector, selectors, base_url, source_url)
+        except SelectolaxError:
+            # Selectors lexbor cannot parse (e.g. :-soup-contains()): fall back to bs4
+            pass
+    
+    if parser == 'lxml' and lxml_html is not None:
+        try:
+            tag_attr = None if selectors or not selector else _tag_attr_selector(selector)
+            if tag_attr:
+                return _scrape_attr_streaming(html, *tag_attr, base_url)
+            return _scrape_page_lxml(html, selector, selectors, base_url, source_url)
+        except (etree.ParserError, ValueError, SelectorError):
+            # Empty documents, encoding declarations lxml rejects, or
+            # selectors only soupsieve understands: fall back to bs4
+            pass
+    
+    soup = BeautifulSoup(html, 'lxml')
+    return _extract_results(soup, selector, selectors, base_url, source_url,
+                            lambda node, css_sel: node.select(css_sel),
+                            lambda node, css_sel: node.select_one(css_sel),
+                            extract_value)
+
+
+def _fetch_serial(
+    urls: Iterable[str],
+    delay: float,
+    timeout: int,
+    session: requests.Session,
+    robots: bool = False,
+    last_modified: dict = None,
+    not_modified: set = None,
+):
+    """Fetch URLs one at a time with a per-host delay, yielding (url, html)."""
+    limiter = HostRateLimiter(delay)
+    for url in urls:
+        if robots and not robots_allows(url, limiter):
+            continue
+        # Rate limiting
+        limiter.wait(url)
+        yield url, fetch_page(url, timeout=timeout, session=session,
+                              last_modified=last_modified, not_modified=not_modified)
+
+
+def _fetch_concurrent(
     urls: list[str],
+    concurrency: int,
+    timeout: int,
+    delay: float,
+    http2: bool,
+    robots: bool = False,
+    last_modified: dict = None,
+    not_modified: set = None,
+):
+    """Fetch all URLs concurrently, returning (url, html) pairs in input order."""
+    limiter = HostRateLimiter(delay)
+    if robots:
+        urls = [url for url in urls if robots_allows(url, limiter)]
+    htmls = asyncio.run(fetch_pages_async(urls, concurrency, timeout, delay, http2, limiter,
+                                          last_modified, not_modified))
+    return list(zip(urls, htmls))
+
+
+# Fetched batches at least this large are parsed in worker processes
+PARALLEL_PARSE_MIN_PAGES = 8
+
+
+def _parse_worker(args: tuple) -> list | None:
+    """Process-pool entry point: parse one fetched page."""
+    html, selector, selectors, base_url, parser = args
+    if not html:
+        return None
+    return scrape_page(html, selector, selectors, base_url=base_url, parser=parser, source_url=base_url)
+
+
+def _parse_pages(pages, selector: str, selectors: dict, parser: str):
+    """Parse (url, html) pairs in this process, yielding (url, results or None)."""
+    for url, html in pages:
+        yield url, _parse_worker((html, selector, selectors, url, parser))
+
+
+def _parse_pages_parallel(pages: list, selector: str, selectors: dict, parser: str):
+    """Parse (url, html) pairs across CPU cores, yielding (url, results or None) in order."""
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(pages) // (workers * 4))
+    tasks = ((html, selector, selectors, url, parser) for url, html in pages)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from zip((url for url, _ in pages), pool.map(_parse_worker, tasks, chunksize=chunksize))
+
+
+def _report_progress(parsed, total: int | None):
+    """
+    Report per-page progress on stderr, keeping stdout clean for JSON output.
+    
+    Uses a tqdm bar when installed, otherwise one line per page.
+    """
+    if tqdm is not None:
+        yield from tqdm(parsed, total=total, file=sys.stderr, unit='url')
+        return
+    total = f"/{total}" if total else ''
+    for i, (url, results) in enumerate(parsed):
+        found = '' if results is None else f" ({len(results)} items)"
+        sys.stderr.write(f"Scraped [{i+1}{total}]: {url}{found}\n")
+        yield url, results
+
+
+def iter_urls(path: str | Path) -> Iterator[str]:
+    """Yield non-empty, non-comment URLs from a file, one line at a time."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+
+
+def is_jsonl_path(path: str | None) -> bool:
+    """True if path names a JSON Lines output file."""
+    return bool(path) and Path(path).suffix.lower() in ('.jsonl', '.ndjson')
+
+
+def scrape_urls(
+    urls: Iterable[str],
     selector: str = None,
     selectors: dict = None,
     delay: float = 1.0,
     output_path: str = None,
+    timeout: int = 30,
+    session: requests.Session = None,
+    concurrency: int = 1,
+    parser: str = DEFAULT_PARSER,
+    http2: bool = False,
+    robots: bool = False,
+    state_path: str = None,
+    not_modified: set = None,
 ) -> list:
     """
-    Scrape multiple URLs with rate limiting.
+    Scrape multiple URLs with per-host rate limiting.
     
     Args:
-        urls: List of URLs to scrape
+        urls: URLs to scrape; serial mode consumes an iterator lazily
         selector: Single CSS selector
         selectors: Dict of selectors for structured data
-        delay: Delay between requests in seconds
+        delay: Minimum delay between requests to the same host in seconds
         output_path: Optional path to save results
+        timeout: Request timeout in seconds
+        session: Session to use (defaults to the shared module session)
+        concurrency: Requests in flight at once; above 1 fetches via aiohttp
+        parser: HTML parser backend ('lxml', 'selectolax' or 'bs4')
+        http2: Fetch via httpx with HTTP/2 multiplexing
+        robots: Honour robots.txt rules and Crawl-delay
+        state_path: JSON file of Last-Modified values; unchanged pages are
+            skipped via If-Modified-Since. Pass a session without requests-cache:
+            a cached session never sends the conditional request
+        not_modified: Optional set collecting URLs skipped as unchanged (304)
     
     Returns:
-        Combined results from all URLs
+        Combined results from all URLs. With a .jsonl/.ndjson output_path the
+        items are written straight to the file and not kept, so this is empty
     """
     all_results = []
+    item_count = 0
+    last_modified = None
+    if state_path:
+        state_file = Path(state_path)
+        last_modified = json.loads(state_file.read_text(encoding='utf-8')) if state_file.exists() else {}
     
-    for i, url in enumerate(urls):
-        print(f"Scraping [{i+1}/{len(urls)}]: {url}")
-        
-        html = fetch_page(url)
-        if html:
-            results = scrape_page(html, selector, selectors, base_url=url)
-            
-            # Add source URL to results
-            if selectors and results:
-                for item in results:
-                    item['_source_url'] = url
-            
-            all_results.extend(results)
-            print(f"  Found {len(results)} items")
-        
-        # Rate limiting
-        if i < len(urls) - 1 and delay > 0:
-            time.sleep(delay)
+    if http2 and httpx is None:
+        print("Note: Install httpx for HTTP/2: pip install 'httpx[http2]'", file=sys.stderr)
+        http2 = False
+    
+    if concurrency > 1 and not http2 and aiohttp is None:
+        print("Note: Install aiohttp for concurrent fetching: pip install aiohttp", file=sys.stderr)
+        concurrency = 1
+    
+    if concurrency > 1 or http2:
+        fetched = _fetch_concurrent(list(urls), concurrency, timeout, delay, http2, robots,
+                                    last_modified, not_modified)
+        # Parsing is CPU-bound, so large batches are spread over processes to sidestep the GIL
+        if len(fetched) >= PARALLEL_PARSE_MIN_PAGES and (os.cpu_count() or 1) > 1:
+            parsed = _parse_pages_parallel(fetched, selector, selectors, parser)
+        else:
+            parsed = _parse_pages(fetched, selector, selectors, parser)
+        parsed = _report_progress(parsed, len(fetched))
+    else:
+        parsed = _parse_pages(
+            _fetch_serial(urls, delay, timeout, session or _SESSION, robots, last_modified, not_modified),
+            selector, selectors, parser,
+        )
+        # Lazily read URL files have no known length
+        parsed = _report_progress(parsed, len(urls) if hasattr(urls, '__len__') else None)
+    
+    extend_results = all_results.extend
+    
+    # JSON Lines output is written per page as results arrive and not kept in memory
+    stream = None
+    if is_jsonl_path(output_path):
+        stream = open(output_path, 'wb')
+    
+    try:
+        for url, results in parsed:
+            if results is not None:
+                item_count += len(results)
+                if stream:
+                    stream.write(b''.join(dumps_json(item, indent=False) + b'\n' for item in results))
+                else:
+                    extend_results(results)
+    finally:
+        if stream:
+            stream.close()
+        if state_path and last_modified is not None:
+            Path(state_path).write_text(json.dumps(last_modified, indent=2), encoding='utf-8')
     
     # Save results
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(all_results, f, indent=2, ensure_ascii=False)
-        print(f"\n✓ Saved {len(all_results)} items to {output_path}")
+        if not stream:
+            with open(output_path, 'wb') as f:
+                f.write(dumps_json(all_results))
+        print(f"\n✓ Saved {item_count} items to {output_path}")
     
     return all_results
 
 
+# "name:selector" pairs; the selector may itself contain ':' (e.g. li:first-child)
+_SELECTORS_ARG = re.compile(r'([^:,]+):([^,]+)')
+
+
 def parse_selectors_arg(selectors_str: str) -> dict:
     """
     Parse selectors argument string.
@@ -210,12 +1031,10 @@ def parse_selectors_arg(selectors_str: str) -> dict:
     Format: "name1:selector1,name2:selector2@attr"
     Example: "title:h1,price:.price,link:a@href"
     """
-    selectors = {}
-    for part in selectors_str.split(','):
-        if ':' in part:
-            name, selector = part.split(':', 1)
-            selectors[name.strip()] = selector.strip()
-    return selectors
+    return {
+        m.group(1).strip(): m.group(2).strip()
+        for m in _SELECTORS_ARG.finditer(selectors_str)
+    }
 
 
 def main():
@@ -227,6 +1046,7 @@ Examples:
   %(prog)s --url "https://example.com" --selector "h1"
   %(prog)s --url "https://example.com" --selectors "title:h1,link:a@href"
   %(prog)s --urls urls.txt --selector ".item" --output data.json --delay 2
+  %(prog)s --urls urls.txt --selector ".item" --concurrency 8
         """
     )
     
@@ -235,9 +1055,24 @@ Examples:
     parser.add_argument("--selector", "-s", help="CSS selector (e.g., '.item', 'a@href')")
     parser.add_argument("--selectors", "-S", help="Multiple selectors (e.g., 'title:h1,price:.price')")
     parser.add_argument("--container", "-c", help="Container selector for structured data")
-    parser.add_argument("--output", "-o", help="Output JSON file")
-    parser.add_argument("--delay", "-d", type=float, default=1.0, help="Delay between requests (seconds)")
+    parser.add_argument("--output", "-o", help="Output JSON file (.jsonl/.ndjson for JSON Lines)")
+    parser.add_argument("--delay", "-d", type=float, default=1.0, help="Delay between requests to the same host (seconds)")
     parser.add_argument("--timeout", "-t", type=int, default=30, help="Request timeout (seconds)")
+    parser.add_argument("--concurrency", "-j", type=int, default=1,
+                        help="Concurrent requests (requires aiohttp)")
+    parser.add_argument("--http2", action="store_true",
+                        help="Multiplex requests over HTTP/2 (requires httpx[http2])")
+    parser.add_argument("--robots", action="store_true",
+                        help="Honour robots.txt rules and Crawl-delay")
+    parser.add_argument("--state",
+                        help="JSON file of Last-Modified values for incremental re-crawls "
+                             "(disables the HTTP cache)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Disable the on-disk HTTP cache (used by serial fetching when requests-cache is installed)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help=f"HTTP cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--parser", choices=PARSERS, default=DEFAULT_PARSER,
+                        help=f"HTML parser backend (default: {DEFAULT_PARSER})")
     
     args = parser.parse_args()
     
@@ -257,7 +1092,7 @@ Examples:
         if not urls_file.exists():
             print(f"Error: URLs file not found: {args.urls}", file=sys.stderr)
             sys.exit(1)
-        urls = [line.strip() for line in urls_file.read_text().splitlines() if line.strip()]
+        urls = iter_urls(urls_file)
     
     # Parse selectors
     selectors = None
@@ -267,19 +1102,35 @@ Examples:
             selectors['_container'] = args.container
     
     # Scrape
+    not_modified = set()
     results = scrape_urls(
         urls=urls,
         selector=args.selector,
         selectors=selectors,
         delay=args.delay,
         output_path=args.output,
+        timeout=args.timeout,
+        # A cached session answers from disk (and hides 304s), so --state bypasses the cache
+        session=create_session(None if args.no_cache or args.state else args.cache_dir),
+        concurrency=args.concurrency,
+        parser=args.parser,
+        http2=args.http2,
+        robots=args.robots,
+        state_path=args.state,
+        not_modified=not_modified,
     )
     
-    # Print results if no output file
+    # Print results if no output file; progress went to stderr, so stdout is pure JSON
     if not args.output:
-        print(json.dumps(results, indent=2, ensure_ascii=False))
+        sys.stdout.buffer.write(dumps_json(results) + b'\n')
     
-    sys.exit(0 if results else 1)
+    # Streamed JSON Lines items are not returned; a non-empty file means something was scraped.
+    # Pages skipped as unchanged (--state) are a success, not a failure
+    if is_jsonl_path(args.output):
+        scraped = Path(args.output).stat().st_size > 0
+    else:
+        scraped = bool(results)
+    sys.exit(0 if scraped or not_modified else 1)
 
 
 if __name__ == "__main__":
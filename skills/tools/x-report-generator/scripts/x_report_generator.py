@@ -13,19 +13,42 @@ Requirements:
 """
 
 import argparse
+import asyncio
+import hashlib
+import heapq
 import json
 import os
 import re
 import sys
 import time
-from collections import Counter
+from collections import Counter, defaultdict
+from string import Template
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, List
-from dataclasses import dataclass, asdict
+from dataclasses import asdict, dataclass, field, fields
 
+try:
+    import imgkit  # 可选：wkhtmltoimage渲染后端
+except ImportError:
+    imgkit = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@(\w+)')
+_STATUS_RE = re.compile(r'/status/(\d+)')
+# X用户名：字母、数字、下划线，最长15位
+_USERNAME_RE = re.compile(r'^[A-Za-z0-9_]{1,15}$')
+MAX_QUERY_LENGTH = 500
+# 批量模式下由关键词生成文件名时替换的字符
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w.-]+')
+
+
+@dataclass(slots=True)
 class TweetData:
     """推文数据结构"""
     id: str
@@ -42,7 +65,30 @@ class TweetData:
     mentions: list
 
 
-@dataclass
+# TweetData字段名，转dict时不必每次调用 fields()/asdict() 的递归深拷贝
+_TWEET_FIELDS = tuple(f.name for f in fields(TweetData))
+
+
+def tweet_to_dict(tweet: TweetData) -> dict:
+    """把TweetData转换为dict（浅拷贝，字段均为简单类型）"""
+    return {name: getattr(tweet, name) for name in _TWEET_FIELDS}
+
+
+def dumps_json(data, indent: bool = False) -> bytes:
+    """序列化为UTF-8 JSON字节，有orjson时使用orjson"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(raw: bytes):
+    """解析JSON字节，有orjson时使用orjson"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)
 class ReportData:
     """报告数据结构"""
     query: str
@@ -63,56 +109,187 @@ class ReportData:
     top_tweets: list
 
 
-class XBrowserScraper:
-    """X网站浏览器爬虫"""
+# 在浏览器内遍历推文卡片，一次page.evaluate返回全部原始字段
+_EXTRACT_TWEETS_JS = """
+() => Array.from(document.querySelectorAll('article[data-testid="tweet"]'), (article) => {
+    const link = article.querySelector('a[href*="/status/"]');
+    if (!link) return null;
+    const innerText = (selector) => {
+        const el = article.querySelector(selector);
+        return el ? el.innerText : null;
+    };
+    
+    // 作者信息：显示名称和 handle
+    let author = '';
+    let authorName = '';
+    const userName = article.querySelector('div[data-testid="User-Name"]');
+    if (userName) {
+        const nameSpan = userName.querySelector('a[href^="/"] span');
+        if (nameSpan) authorName = nameSpan.innerText.trim();
+        for (const a of userName.querySelectorAll('a[href^="/"]')) {
+            const href = a.getAttribute('href') || '';
+            if (href.startsWith('/') && !href.includes('/status/')) {
+                author = href;
+                break;
+            }
+        }
+    }
+    
+    const avatar = article.querySelector('img[src*="profile_images"]');
+    const time = article.querySelector('time');
+    return {
+        href: link.getAttribute('href') || '',
+        author: author,
+        author_name: authorName,
+        author_avatar: avatar ? avatar.getAttribute('src') : '',
+        text: innerText('div[data-testid="tweetText"]') || '',
+        replies: innerText('button[data-testid="reply"] span span'),
+        retweets: innerText('button[data-testid="retweet"] span span'),
+        likes: innerText('button[data-testid="like"] span span'),
+        views: innerText('a[href*="/analytics"] span span'),
+        created_at: time ? time.getAttribute('datetime') : null,
+    };
+}).filter(Boolean)
+"""
+
+# 页面上最后一条推文与上次不同时返回true，用于滚动后等待新内容
+_NEW_TWEETS_JS = """
+(lastHref) => {
+    const articles = document.querySelectorAll('article[data-testid="tweet"]');
+    if (!articles.length) return false;
+    const link = articles[articles.length - 1].querySelector('a[href*="/status/"]');
+    return (link ? link.getAttribute('href') : null) !== lastHref;
+}
+"""
+
+# 单个浏览器上下文中同时爬取的页面数
+MAX_PARALLEL_PAGES = 3
+
+# 浏览器累计创建多少个上下文后重启，避免长时间运行时内存持续增长
+BROWSER_RECYCLE_AFTER = 50
+
+# 爬取时不需要下载的资源类型（头像只取URL，不需要图片内容）
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# 连续多少次滚动没有新推文就认为已到底（结果不足limit条时不再空等）
+MAX_IDLE_SCROLLS = 3
+
+
+async def _block_heavy_resources(route):
+    """拦截图片/视频/字体请求，其余请求正常放行"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """保持一个预热的Chromium实例，为每个任务分配新的BrowserContext"""
     
-    def __init__(self, headless: bool = True, cookies_file: str = None):
+    def __init__(self, headless: bool = True, recycle_after: int = BROWSER_RECYCLE_AFTER):
         self.headless = headless
-        self.cookies_file = cookies_file
-        self.browser = None
-        self.context = None
-        self.page = None
+        self.recycle_after = recycle_after
+        self._playwright = None
+        self._browser = None
+        self._uses = 0
+        self._lock = asyncio.Lock()
     
-    def _init_browser(self):
-        """初始化浏览器"""
-        from playwright.sync_api import sync_playwright
+    async def _launch(self):
+        """启动Playwright和浏览器"""
+        from playwright.async_api import async_playwright
         
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
             headless=self.headless,
             args=['--disable-blink-features=AutomationControlled']
         )
+        self._uses = 0
+    
+    async def new_context(self, **kwargs):
+        """创建新的上下文；关闭上下文远比重启浏览器便宜"""
+        async with self._lock:
+            if self._browser is None:
+                await self._launch()
+            elif self._uses >= self.recycle_after and not self._browser.contexts:
+                # 没有进行中的任务时才回收浏览器
+                await self._browser.close()
+                await self._launch()
+            self._uses += 1
+            return await self._browser.new_context(**kwargs)
+    
+    async def close(self):
+        """关闭浏览器和Playwright"""
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+        self._browser = self._playwright = None
+
+
+class XBrowserScraper:
+    """X网站浏览器爬虫（基于 playwright.async_api，多个页面可并发爬取）"""
+    
+    def __init__(self, headless: bool = True, cookies_file: str = None, pool: BrowserPool = None,
+                 tweets_file: str = None, quiet: bool = False):
+        self.headless = headless
+        # quiet时不输出进度信息，错误和警告照常输出
+        self.quiet = quiet
+        self.cookies_file = cookies_file
+        self.pool = pool
+        self._owns_pool = False
+        self.context = None
+        self._page_sem = None
+        # 每次滚动后把新推文以NDJSON追加到该文件
+        self.tweets_file = tweets_file
+        self._tweets_out = None
+    
+    def _info(self, message: str = "", **kwargs):
+        """输出进度信息"""
+        if not self.quiet:
+            print(message, **kwargs)
+    
+    async def _init_browser(self, block_resources: bool = True):
+        """初始化浏览器上下文（浏览器本身由BrowserPool复用）"""
+        if self.pool is None:
+            self.pool = BrowserPool(headless=self.headless)
+            self._owns_pool = True
+        
+        # 加载登录状态（如果有）；兼容旧版只保存cookies列表的文件
+        storage_state = None
+        if self.cookies_file and Path(self.cookies_file).exists():
+            storage_state = loads_json(Path(self.cookies_file).read_bytes())
+            if isinstance(storage_state, list):
+                storage_state = {"cookies": storage_state, "origins": []}
         
         # 创建上下文，模拟真实浏览器
-        self.context = self.browser.new_context(
+        self.context = await self.pool.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            locale="zh-CN"
+            locale="zh-CN",
+            storage_state=storage_state
         )
         
-        # 加载cookies（如果有）
-        if self.cookies_file and Path(self.cookies_file).exists():
-            with open(self.cookies_file, 'r') as f:
-                cookies = json.load(f)
-                self.context.add_cookies(cookies)
-        
-        self.page = self.context.new_page()
-        
-        # 注入脚本绕过检测
-        self.page.add_init_script("""
+        # 注入脚本绕过检测（上下文级别，对所有页面生效）
+        await self.context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
         """)
+        
+        # 爬取时屏蔽图片/视频/字体；登录时需要完整页面，不屏蔽
+        if block_resources:
+            await self.context.route("**/*", _block_heavy_resources)
+        
+        self._page_sem = asyncio.Semaphore(MAX_PARALLEL_PAGES)
     
-    def _close_browser(self):
-        """关闭浏览器"""
-        if self.page:
-            self.page.close()
+    async def _close_browser(self):
+        """关闭上下文；浏览器仅在由本爬虫创建时关闭"""
         if self.context:
-            self.context.close()
-        if self.browser:
-            self.browser.close()
-        if hasattr(self, 'playwright'):
-            self.playwright.stop()
+            await self.context.close()
+            self.context = None
+        if self._owns_pool:
+            await self.pool.close()
+            self.pool = None
+            self._owns_pool = False
     
     def _parse_count(self, text: str) -> int:
         """解析数字（支持K、M、B后缀）"""
@@ -137,306 +314,360 @@ class XBrowserScraper:
     
     def _extract_hashtags(self, text: str) -> list:
         """提取标签"""
-        return re.findall(r'#(\w+)', text)
+        return _HASHTAG_RE.findall(text)
     
     def _extract_mentions(self, text: str) -> list:
         """提取@用户"""
-        return re.findall(r'@(\w+)', text)
+        return _MENTION_RE.findall(text)
     
-    def _scroll_and_collect(self, limit: int) -> List[dict]:
-        """滚动页面并收集推文数据"""
+    async def _wait_for_tweets(self, page) -> bool:
+        """等待首批推文出现；超时（需要登录、账号不存在等）返回False"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
+        try:
+            await page.wait_for_selector('article[data-testid="tweet"]', timeout=15000)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+    
+    async def _wait_for_new_tweets(self, page, last_href: str):
+        """等待最后一条推文变化（X会回收滚出视口的卡片，所以不比较卡片数量）"""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
+        try:
+            await page.wait_for_function(_NEW_TWEETS_JS, arg=last_href, timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
+    
+    async def _scroll_and_collect(self, page, limit: int, stats: 'IncrementalStats', query: str) -> List[TweetData]:
+        """滚动页面收集推文数据，同时把每条推文累计到stats；query 写入NDJSON以区分批量中的来源"""
         tweets_data = []
         seen_ids = set()
         scroll_count = 0
         max_scrolls = limit // 5 + 10  # 估算需要滚动的次数
         
-        while len(tweets_data) < limit and scroll_count < max_scrolls:
-            # 等待推文加载
-            self.page.wait_for_timeout(1500)
+        idle_scrolls = 0
+        
+        last_href = None
+        
+        while len(tweets_data) < limit and scroll_count < max_scrolls and idle_scrolls < MAX_IDLE_SCROLLS:
+            batch_start = len(tweets_data)
             
-            # 获取所有推文元素
-            tweet_articles = self.page.query_selector_all('article[data-testid="tweet"]')
+            # 在页面内一次性提取所有推文字段，避免逐元素的IPC往返
+            raws = await page.evaluate(_EXTRACT_TWEETS_JS)
+            if raws:
+                last_href = raws[-1]['href']
             
-            for article in tweet_articles:
-                try:
-                    # 获取推文唯一标识
-                    tweet_link = article.query_selector('a[href*="/status/"]')
-                    if not tweet_link:
-                        continue
-                    
-                    href = tweet_link.get_attribute('href') or ''
-                    tweet_id_match = re.search(r'/status/(\d+)', href)
-                    if not tweet_id_match:
-                        continue
-                    
-                    tweet_id = tweet_id_match.group(1)
-                    if tweet_id in seen_ids:
-                        continue
-                    seen_ids.add(tweet_id)
-                    
-                    # 提取作者信息
-                    author_elem = article.query_selector('div[data-testid="User-Name"]')
-                    author = ""
-                    author_name = ""
-                    if author_elem:
-                        # 用户名 @xxx
-                        username_span = author_elem.query_selector('a[href^="/"] span')
-                        if username_span:
-                            author_name = username_span.inner_text().strip()
-                        # handle
-                        handle_links = author_elem.query_selector_all('a[href^="/"]')
-                        for link in handle_links:
-                            href = link.get_attribute('href') or ''
-                            if href.startswith('/') and '/status/' not in href:
-                                author = href.strip('/')
-                                break
-                    
-                    # 提取头像
-                    avatar_elem = article.query_selector('img[src*="profile_images"]')
-                    author_avatar = avatar_elem.get_attribute('src') if avatar_elem else ""
-                    
-                    # 提取推文内容
-                    text_elem = article.query_selector('div[data-testid="tweetText"]')
-                    text = text_elem.inner_text() if text_elem else ""
-                    
-                    # 提取互动数据
-                    reply_elem = article.query_selector('button[data-testid="reply"] span span')
-                    retweet_elem = article.query_selector('button[data-testid="retweet"] span span')
-                    like_elem = article.query_selector('button[data-testid="like"] span span')
-                    view_elem = article.query_selector('a[href*="/analytics"] span span')
-                    
-                    replies = self._parse_count(reply_elem.inner_text() if reply_elem else "0")
-                    retweets = self._parse_count(retweet_elem.inner_text() if retweet_elem else "0")
-                    likes = self._parse_count(like_elem.inner_text() if like_elem else "0")
-                    views = self._parse_count(view_elem.inner_text() if view_elem else "0")
-                    
-                    # 提取时间
-                    time_elem = article.query_selector('time')
-                    created_at = time_elem.get_attribute('datetime') if time_elem else datetime.now().isoformat()
-                    
-                    tweets_data.append({
-                        'id': tweet_id,
-                        'text': text,
-                        'author': author,
-                        'author_name': author_name,
-                        'author_avatar': author_avatar,
-                        'likes': likes,
-                        'retweets': retweets,
-                        'replies': replies,
-                        'views': views,
-                        'created_at': created_at,
-                        'hashtags': self._extract_hashtags(text),
-                        'mentions': self._extract_mentions(text)
-                    })
-                    
-                    if len(tweets_data) >= limit:
-                        break
-                        
-                except Exception as e:
+            for raw in raws:
+                # 获取推文唯一标识
+                tweet_id_match = _STATUS_RE.search(raw['href'])
+                if not tweet_id_match:
+                    continue
+                
+                tweet_id = tweet_id_match.group(1)
+                if tweet_id in seen_ids:
                     continue
+                seen_ids.add(tweet_id)
+                
+                tweet = TweetData(**{
+                    'id': tweet_id,
+                    'text': raw['text'],
+                    'author': raw['author'].strip('/'),
+                    'author_name': raw['author_name'],
+                    'author_avatar': raw['author_avatar'],
+                    'likes': self._parse_count(raw['likes'] or "0"),
+                    'retweets': self._parse_count(raw['retweets'] or "0"),
+                    'replies': self._parse_count(raw['replies'] or "0"),
+                    'views': self._parse_count(raw['views'] or "0"),
+                    'created_at': raw['created_at'] or datetime.now().isoformat(),
+                    'hashtags': [],
+                    'mentions': []
+                })
+                tweets_data.append(tweet)
+                
+                if len(tweets_data) >= limit:
+                    break
             
             # 滚动页面
-            self.page.evaluate("window.scrollBy(0, 800)")
+            await page.evaluate("window.scrollBy(0, 800)")
             scroll_count += 1
             
-            print(f"\r📊 已收集 {len(tweets_data)}/{limit} 条推文...", end="", flush=True)
-        
-        print()  # 换行
-        return tweets_data
-
-    def search_tweets(self, query: str, limit: int = 50) -> List[TweetData]:
-        """搜索推文"""
-        try:
-            self._init_browser()
-            
-            # 构建搜索URL
-            encoded_query = query.replace(' ', '%20')
-            search_url = f"https://x.com/search?q={encoded_query}&src=typed_query&f=live"
-            
-            print(f"🌐 正在访问: {search_url}")
-            self.page.goto(search_url, wait_until="networkidle", timeout=60000)
-            
-            # 等待页面加载
-            print("⏳ 等待页面加载...")
-            self.page.wait_for_timeout(3000)
-            
-            # 检查是否需要登录
-            if "login" in self.page.url.lower():
-                print("⚠️ 需要登录才能搜索，请提供cookies文件或手动登录")
-                print("提示: 使用 --save-cookies 参数保存登录状态")
-                return []
+            # 页面加载新推文期间再处理本批：提取标签/@用户并累计统计
+            batch = tweets_data[batch_start:]
+            idle_scrolls = 0 if batch else idle_scrolls + 1
+            for tweet in batch:
+                tweet.hashtags = self._extract_hashtags(tweet.text)
+                tweet.mentions = self._extract_mentions(tweet.text)
+                stats.update(tweet)
             
-            # 收集推文
-            print(f"🔍 开始收集推文 (目标: {limit} 条)...")
-            tweets_raw = self._scroll_and_collect(limit)
+            # 新推文写入文件（在线程中写入，不阻塞其他页面）
+            if self._tweets_out and batch:
+                lines = b''.join(dumps_json({'query': query, **tweet_to_dict(t)}) + b'\n' for t in batch)
+                await asyncio.to_thread(self._tweets_out.write, lines)
             
-            # 转换为TweetData对象
-            tweets = [TweetData(**t) for t in tweets_raw]
-            
-            return tweets
+            self._info(f"\r📊 已收集 {len(tweets_data)}/{limit} 条推文...", end="", flush=True)
             
+            # 等待滚动后加载出新推文，而不是固定等待
+            if len(tweets_data) < limit:
+                await self._wait_for_new_tweets(page, last_href)
+        
+        self._info()  # 换行
+        return tweets_data
+    
+    async def _search(self, query: str, limit: int) -> tuple:
+        """在已启动的浏览器中打开新页面搜索推文，返回 (推文列表, 统计量)"""
+        async with self._page_sem:
+            page = await self.context.new_page()
+            try:
+                # 构建搜索URL
+                encoded_query = query.replace(' ', '%20')
+                search_url = f"https://x.com/search?q={encoded_query}&src=typed_query&f=live"
+                
+                self._info(f"🌐 正在访问: {search_url}")
+                # X 有持续的后台请求，networkidle 很慢才触发；DOM 就绪后等待推文出现即可
+                await page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
+                
+                # 等待页面加载
+                self._info("⏳ 等待页面加载...")
+                has_tweets = await self._wait_for_tweets(page)
+                
+                # 检查是否需要登录
+                if "login" in page.url.lower():
+                    print("⚠️ 需要登录才能搜索，请提供cookies文件或手动登录")
+                    print("提示: 使用 --save-cookies 参数保存登录状态")
+                    return [], IncrementalStats()
+                
+                if not has_tweets:
+                    print(f"⚠️ 没有找到与 \"{query}\" 相关的推文")
+                    return [], IncrementalStats()
+                
+                # 收集推文
+                self._info(f"🔍 开始收集推文 (目标: {limit} 条)...")
+                stats = IncrementalStats()
+                return await self._scroll_and_collect(page, limit, stats, query), stats
+                
+            except Exception as e:
+                print(f"❌ 爬取失败: {e}")
+                return [], IncrementalStats()
+            finally:
+                await page.close()
+    
+    async def _user_tweets(self, username: str, limit: int) -> tuple:
+        """在已启动的浏览器中打开新页面获取用户推文，返回 (推文列表, 统计量)"""
+        async with self._page_sem:
+            page = await self.context.new_page()
+            try:
+                # 访问用户主页
+                user_url = f"https://x.com/{username}"
+                
+                self._info(f"🌐 正在访问: {user_url}")
+                # X 有持续的后台请求，networkidle 很慢才触发；DOM 就绪后等待推文出现即可
+                await page.goto(user_url, wait_until="domcontentloaded", timeout=60000)
+                
+                # 等待页面加载
+                self._info("⏳ 等待页面加载...")
+                has_tweets = await self._wait_for_tweets(page)
+                
+                # 检查用户是否存在
+                if not has_tweets:
+                    content = await page.content()
+                    if "这个账号不存在" in content or "This account doesn't exist" in content:
+                        print(f"❌ 用户 @{username} 不存在")
+                    else:
+                        print(f"⚠️ 无法获取 @{username} 的推文（可能需要登录或账号受保护）")
+                    return [], IncrementalStats()
+                
+                # 收集推文
+                self._info(f"🔍 开始收集 @{username} 的推文 (目标: {limit} 条)...")
+                stats = IncrementalStats()
+                return await self._scroll_and_collect(page, limit, stats, f"@{username}"), stats
+                
+            except Exception as e:
+                print(f"❌ 爬取失败: {e}")
+                return [], IncrementalStats()
+            finally:
+                await page.close()
+    
+    async def scrape_many(self, targets: List[tuple], limit: int = 50) -> List[tuple]:
+        """
+        共用一个浏览器/上下文并发爬取多个目标，每个目标返回 (推文列表, 统计量)。
+        
+        targets: [('search', 关键词) 或 ('user', 用户名), ...]
+        同时打开的页面数受 MAX_PARALLEL_PAGES 限制，总耗时约为最慢页面的耗时。
+        """
+        try:
+            if self.tweets_file:
+                self._tweets_out = open(self.tweets_file, 'wb')
+            await self._init_browser()
+            return await asyncio.gather(*[
+                self._search(value, limit) if kind == 'search' else self._user_tweets(value, limit)
+                for kind, value in targets
+            ])
         except Exception as e:
             print(f"❌ 爬取失败: {e}")
-            return []
+            return [([], IncrementalStats()) for _ in targets]
         finally:
-            self._close_browser()
+            await self._close_browser()
+            if self._tweets_out:
+                self._tweets_out.close()
+                self._tweets_out = None
+    
+    def search_tweets(self, query: str, limit: int = 50) -> List[TweetData]:
+        """搜索推文"""
+        return asyncio.run(self.scrape_many([('search', query)], limit))[0][0]
     
     def get_user_tweets(self, username: str, limit: int = 50) -> List[TweetData]:
         """获取用户推文"""
-        try:
-            self._init_browser()
-            
-            # 访问用户主页
-            user_url = f"https://x.com/{username}"
-            
-            print(f"🌐 正在访问: {user_url}")
-            self.page.goto(user_url, wait_until="networkidle", timeout=60000)
-            
-            # 等待页面加载
-            print("⏳ 等待页面加载...")
-            self.page.wait_for_timeout(3000)
-            
-            # 检查用户是否存在
-            if "这个账号不存在" in self.page.content() or "This account doesn't exist" in self.page.content():
-                print(f"❌ 用户 @{username} 不存在")
-                return []
-            
-            # 收集推文
-            print(f"🔍 开始收集 @{username} 的推文 (目标: {limit} 条)...")
-            tweets_raw = self._scroll_and_collect(limit)
-            
-            # 转换为TweetData对象
-            tweets = [TweetData(**t) for t in tweets_raw]
-            
-            return tweets
-            
-        except Exception as e:
-            print(f"❌ 爬取失败: {e}")
-            return []
-        finally:
-            self._close_browser()
+        return asyncio.run(self.scrape_many([('user', username)], limit))[0][0]
     
-    def save_cookies(self, filepath: str):
-        """保存cookies用于后续登录"""
+    def search_many(self, queries: List[str], limit: int = 50) -> List[List[TweetData]]:
+        """在同一个浏览器上下文中批量搜索多个关键词，按顺序返回各自的推文"""
+        return [tweets for tweets, _ in asyncio.run(self.scrape_many([('search', q) for q in queries], limit))]
+    
+    async def _save_cookies(self, filepath: str):
         try:
-            self._init_browser()
+            await self._init_browser(block_resources=False)
+            page = await self.context.new_page()
             
             print("🌐 正在打开X登录页面...")
-            self.page.goto("https://x.com/login", wait_until="networkidle")
+            await page.goto("https://x.com/login", wait_until="networkidle")
             
             print("👆 请在浏览器中手动登录...")
             print("   登录完成后，按回车键继续...")
-            input()
+            await asyncio.to_thread(input)
             
             # 等待登录完成
-            self.page.wait_for_timeout(2000)
+            await asyncio.sleep(2)
             
-            # 保存cookies
-            cookies = self.context.cookies()
-            with open(filepath, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            # 保存登录状态（cookies + localStorage）
+            await self.context.storage_state(path=filepath)
             
-            print(f"✓ Cookies已保存到: {filepath}")
+            print(f"✓ 登录状态已保存到: {filepath}")
             
         except Exception as e:
             print(f"❌ 保存失败: {e}")
         finally:
-            self._close_browser()
+            await self._close_browser()
+    
+    def save_cookies(self, filepath: str):
+        """保存登录状态（storage_state格式）用于后续登录"""
+        asyncio.run(self._save_cookies(filepath))
+
+
+# 简单情感分析关键词
+POSITIVE_WORDS = ('好', '棒', '赞', '喜欢', 'love', 'great', 'awesome', 'amazing', 'excellent', '🚀', '💪', '🎉', '❤️', '👍', '✨')
+NEGATIVE_WORDS = ('差', '烂', '讨厌', 'hate', 'bad', 'terrible', 'awful', 'worst', '😢', '😡', '👎', '💔', '😤')
+
+
+def sentiment_score(text_lower: str) -> int:
+    """出现的正面关键词数减去负面关键词数（每个关键词只计一次）"""
+    return (sum(map(text_lower.__contains__, POSITIVE_WORDS))
+            - sum(map(text_lower.__contains__, NEGATIVE_WORDS)))
+
+
+@dataclass
+class IncrementalStats:
+    """逐条推文累计的统计量，可在爬取过程中边收集边更新"""
+    total_likes: int = 0
+    total_retweets: int = 0
+    total_replies: int = 0
+    total_views: int = 0
+    hashtags: Counter = field(default_factory=Counter)
+    # 作者 -> [name, avatar, tweets, engagement]
+    authors: defaultdict = field(default_factory=lambda: defaultdict(lambda: [None, None, 0, 0]))
+    hourly: Counter = field(default_factory=Counter)
+    sentiment_positive: int = 0
+    sentiment_neutral: int = 0
+    sentiment_negative: int = 0
+    
+    def update(self, t: TweetData):
+        """累计一条推文"""
+        likes = t.likes
+        retweets = t.retweets
+        
+        # 基础统计
+        self.total_likes += likes
+        self.total_retweets += retweets
+        self.total_replies += t.replies
+        self.total_views += t.views
+        
+        # 热门标签
+        self.hashtags.update(t.hashtags)
+        
+        # 热门作者
+        entry = self.authors[t.author]
+        if not entry[2]:
+            entry[0] = t.author_name
+            entry[1] = t.author_avatar
+        entry[2] += 1
+        entry[3] += likes + retweets
+        
+        # 时间分布（X的时间格式固定为 YYYY-MM-DDTHH:MM:SS.000Z，直接截取小时）
+        try:
+            self.hourly[int(t.created_at[11:13])] += 1
+        except ValueError:
+            pass
+        
+        # 简单情感分析（基于关键词）
+        score = sentiment_score(t.text.lower())
+        if score > 0:
+            self.sentiment_positive += 1
+        elif score < 0:
+            self.sentiment_negative += 1
+        else:
+            self.sentiment_neutral += 1
 
 
 class DataAnalyzer:
     """数据分析器"""
     
-    def analyze(self, tweets: List[TweetData], query: str, report_type: str = "search") -> ReportData:
-        """分析推文数据并生成报告数据"""
+    def analyze(self, tweets: List[TweetData], query: str, report_type: str = "search",
+                stats: 'IncrementalStats' = None) -> ReportData:
+        """分析推文数据并生成报告数据；stats 为爬取时已累计的统计量"""
         if not tweets:
             return self._empty_report(query, report_type)
         
-        # 基础统计
-        total_likes = sum(t.likes for t in tweets)
-        total_retweets = sum(t.retweets for t in tweets)
-        total_replies = sum(t.replies for t in tweets)
-        total_views = sum(t.views for t in tweets)
+        # 爬取时未累计统计量则在此单次遍历计算
+        if stats is None:
+            stats = IncrementalStats()
+            for t in tweets:
+                stats.update(t)
         
         # 平均互动率
-        avg_engagement = (total_likes + total_retweets + total_replies) / len(tweets)
+        avg_engagement = (stats.total_likes + stats.total_retweets + stats.total_replies) / len(tweets)
         
-        # 热门标签
-        all_hashtags = []
-        for t in tweets:
-            all_hashtags.extend(t.hashtags)
         top_hashtags = [{"tag": tag, "count": count} 
-                       for tag, count in Counter(all_hashtags).most_common(10)]
-        
-        # 热门作者
-        author_stats = {}
-        for t in tweets:
-            if t.author not in author_stats:
-                author_stats[t.author] = {
-                    "name": t.author_name,
-                    "avatar": t.author_avatar,
-                    "tweets": 0,
-                    "engagement": 0
-                }
-            author_stats[t.author]["tweets"] += 1
-            author_stats[t.author]["engagement"] += t.likes + t.retweets
-        
-        top_authors = sorted(
-            [{"author": k, **v} for k, v in author_stats.items()],
-            key=lambda x: x["engagement"],
-            reverse=True
-        )[:5]
-        
-        # 时间分布
-        hourly = Counter()
-        for t in tweets:
-            try:
-                dt = datetime.fromisoformat(t.created_at.replace('Z', '+00:00'))
-                hourly[dt.hour] += 1
-            except:
-                pass
-        hourly_distribution = {str(h): hourly.get(h, 0) for h in range(24)}
+                       for tag, count in stats.hashtags.most_common(10)]
         
-        # 简单情感分析（基于关键词）
-        positive_words = ['好', '棒', '赞', '喜欢', 'love', 'great', 'awesome', 'amazing', 'excellent', '🚀', '💪', '🎉', '❤️', '👍', '✨']
-        negative_words = ['差', '烂', '讨厌', 'hate', 'bad', 'terrible', 'awful', 'worst', '😢', '😡', '👎', '💔', '😤']
-        
-        sentiment_positive = 0
-        sentiment_negative = 0
-        sentiment_neutral = 0
+        # 只为前5名作者构造字典
+        top_authors = [
+            {"author": k, "name": name, "avatar": avatar, "tweets": count, "engagement": engagement}
+            for k, (name, avatar, count, engagement)
+            in heapq.nlargest(5, stats.authors.items(), key=lambda kv: kv[1][3])
+        ]
         
-        for t in tweets:
-            text_lower = t.text.lower()
-            pos_count = sum(1 for w in positive_words if w in text_lower)
-            neg_count = sum(1 for w in negative_words if w in text_lower)
-            
-            if pos_count > neg_count:
-                sentiment_positive += 1
-            elif neg_count > pos_count:
-                sentiment_negative += 1
-            else:
-                sentiment_neutral += 1
+        hourly_distribution = {str(h): stats.hourly.get(h, 0) for h in range(24)}
         
         # 热门推文
-        top_tweets = sorted(tweets, key=lambda t: t.likes + t.retweets, reverse=True)[:5]
+        top_tweets = heapq.nlargest(5, tweets, key=lambda t: t.likes + t.retweets)
         
         return ReportData(
             query=query,
             report_type=report_type,
             generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             total_tweets=len(tweets),
-            total_likes=total_likes,
-            total_retweets=total_retweets,
-            total_replies=total_replies,
-            total_views=total_views,
+            total_likes=stats.total_likes,
+            total_retweets=stats.total_retweets,
+            total_replies=stats.total_replies,
+            total_views=stats.total_views,
             avg_engagement=round(avg_engagement, 1),
             top_hashtags=top_hashtags,
             top_authors=top_authors,
             hourly_distribution=hourly_distribution,
-            sentiment_positive=sentiment_positive,
-            sentiment_neutral=sentiment_neutral,
-            sentiment_negative=sentiment_negative,
-            top_tweets=[asdict(t) for t in top_tweets]
+            sentiment_positive=stats.sentiment_positive,
+            sentiment_neutral=stats.sentiment_neutral,
+            sentiment_negative=stats.sentiment_negative,
+            top_tweets=[tweet_to_dict(t) for t in top_tweets]
         )
     
     def _empty_report(self, query: str, report_type: str) -> ReportData:
@@ -461,115 +692,67 @@ class DataAnalyzer:
         )
 
 
-class HTMLReportGenerator:
-    """HTML报告生成器"""
-    
-    def __init__(self, theme: str = "dark"):
-        self.theme = theme
-    
-    def generate(self, data: ReportData) -> str:
-        """生成HTML报告"""
-        # 主题颜色
-        if self.theme == "dark":
-            bg_color = "#0f172a"
-            card_bg = "#1e293b"
-            text_color = "#f1f5f9"
-            text_muted = "#94a3b8"
-            accent = "#3b82f6"
-            accent2 = "#8b5cf6"
-            success = "#22c55e"
-            warning = "#f59e0b"
-            danger = "#ef4444"
-        else:
-            bg_color = "#f8fafc"
-            card_bg = "#ffffff"
-            text_color = "#1e293b"
-            text_muted = "#64748b"
-            accent = "#2563eb"
-            accent2 = "#7c3aed"
-            success = "#16a34a"
-            warning = "#d97706"
-            danger = "#dc2626"
-        
-        # 生成时间分布图表数据
-        hours = list(range(24))
-        hour_values = [data.hourly_distribution.get(str(h), 0) for h in hours]
-        max_hour_val = max(hour_values) if hour_values else 1
-        hour_bars = ""
-        for h, v in zip(hours, hour_values):
-            height = int((v / max_hour_val) * 60) if max_hour_val > 0 else 0
-            hour_bars += f'''
-                <div style="display:flex;flex-direction:column;align-items:center;gap:4px;">
-                    <div style="width:12px;height:{height}px;background:linear-gradient(to top,{accent},{accent2});border-radius:4px;min-height:2px;"></div>
-                    <span style="font-size:10px;color:{text_muted};">{h}</span>
-                </div>
-            '''
-        
-        # 生成情感分析
-        total_sentiment = data.sentiment_positive + data.sentiment_neutral + data.sentiment_negative
-        if total_sentiment > 0:
-            pos_pct = int((data.sentiment_positive / total_sentiment) * 100)
-            neu_pct = int((data.sentiment_neutral / total_sentiment) * 100)
-            neg_pct = 100 - pos_pct - neu_pct
-        else:
-            pos_pct, neu_pct, neg_pct = 0, 0, 0
-        
-        # 生成热门标签HTML
-        hashtags_html = ""
-        for tag in data.top_hashtags[:8]:
-            hashtags_html += f'''
-                <span style="background:{accent}22;color:{accent};padding:6px 12px;border-radius:20px;font-size:13px;">
-                    #{tag['tag']} <span style="color:{text_muted};">({tag['count']})</span>
-                </span>
-            '''
-        
-        # 生成热门作者HTML
-        authors_html = ""
-        for i, author in enumerate(data.top_authors[:5], 1):
-            avatar = author.get('avatar', '')
-            avatar_html = f'<img src="{avatar}" style="width:32px;height:32px;border-radius:50%;">' if avatar and avatar.startswith('http') else f'<span style="font-size:20px;width:32px;text-align:center;">👤</span>'
-            authors_html += f'''
-                <div style="display:flex;align-items:center;gap:12px;padding:12px;background:{bg_color};border-radius:8px;">
-                    {avatar_html}
-                    <div style="flex:1;min-width:0;">
-                        <div style="font-weight:600;color:{text_color};white-space:nowrap;overflow:hidden;text-overflow:ellipsis;">@{author['author']}</div>
-                        <div style="font-size:12px;color:{text_muted};">{author['tweets']} 推文 · {author['engagement']:,} 互动</div>
-                    </div>
-                    <span style="background:{accent};color:white;padding:4px 8px;border-radius:4px;font-size:12px;">#{i}</span>
-                </div>
-            '''
-        
-        # 生成热门推文HTML
-        tweets_html = ""
-        for tweet in data.top_tweets[:3]:
-            avatar = tweet.get('author_avatar', '')
-            avatar_html = f'<img src="{avatar}" style="width:24px;height:24px;border-radius:50%;">' if avatar and avatar.startswith('http') else '<span style="font-size:18px;">👤</span>'
-            text_preview = tweet['text'][:150] + ('...' if len(tweet['text']) > 150 else '')
-            tweets_html += f'''
-                <div style="padding:16px;background:{bg_color};border-radius:12px;border-left:4px solid {accent};">
-                    <div style="display:flex;align-items:center;gap:8px;margin-bottom:8px;">
-                        {avatar_html}
-                        <span style="font-weight:600;color:{text_color};">@{tweet['author']}</span>
-                    </div>
-                    <p style="color:{text_color};margin:0 0 12px 0;line-height:1.5;font-size:14px;">{text_preview}</p>
-                    <div style="display:flex;gap:16px;font-size:13px;color:{text_muted};">
-                        <span>❤️ {tweet['likes']:,}</span>
-                        <span>🔄 {tweet['retweets']:,}</span>
-                        <span>💬 {tweet['replies']:,}</span>
-                        <span>👁️ {tweet['views']:,}</span>
-                    </div>
-                </div>
-            '''
-        
-        # 格式化大数字
-        def format_num(n):
-            if n >= 1000000:
-                return f"{n/1000000:.1f}M"
-            elif n >= 1000:
-                return f"{n/1000:.1f}K"
-            return str(n)
+# 报告数据缓存：同一目标短时间内重复生成报告时跳过爬取和分析
+CACHE_DIR = Path.home() / ".cache" / "x-report-generator"
+CACHE_TTL = 15 * 60  # 秒
+
+
+def _cache_path(command: str, target: str, limit: int) -> Path:
+    """缓存文件路径，按 (命令, 关键词/用户名, 数量) 区分"""
+    digest = hashlib.sha1(f"{target}\0{limit}".encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"{command}-{digest}.json"
+
+
+def load_cached_report(command: str, target: str, limit: int) -> Optional[ReportData]:
+    """读取未过期的缓存报告数据，没有或已过期时返回None"""
+    path = _cache_path(command, target, limit)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL:
+            return None
+        return ReportData(**loads_json(path.read_bytes()))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_cached_report(command: str, target: str, limit: int, report_data: ReportData):
+    """缓存分析后的报告数据；写入失败不影响报告生成"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # orjson可直接序列化dataclass，省去asdict()的递归深拷贝
+        payload = report_data if orjson is not None else asdict(report_data)
+        _cache_path(command, target, limit).write_bytes(dumps_json(payload))
+    except OSError:
+        pass
+
+
+# 报告主题配色
+THEMES = {
+    "dark": {
+        "bg_color": "#0f172a",
+        "card_bg": "#1e293b",
+        "text_color": "#f1f5f9",
+        "text_muted": "#94a3b8",
+        "accent": "#3b82f6",
+        "accent2": "#8b5cf6",
+        "success": "#22c55e",
+        "warning": "#f59e0b",
+        "danger": "#ef4444",
+    },
+    "light": {
+        "bg_color": "#f8fafc",
+        "card_bg": "#ffffff",
+        "text_color": "#1e293b",
+        "text_muted": "#64748b",
+        "accent": "#2563eb",
+        "accent2": "#7c3aed",
+        "success": "#16a34a",
+        "warning": "#d97706",
+        "danger": "#dc2626",
+    },
+}
 
-        html = f'''<!DOCTYPE html>
+# 报告页面模板：$name 为主题颜色（按主题预先替换），{name} 为每份报告的动态数据
+_REPORT_TEMPLATE = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -577,8 +760,8 @@ class HTMLReportGenerator:
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
         body {{ 
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'PingFang SC', 'Microsoft YaHei', sans-serif;
-            background: {bg_color};
-            color: {text_color};
+            background: $bg_color;
+            color: $text_color;
             padding: 32px;
             min-width: 900px;
         }}
@@ -592,65 +775,65 @@ class HTMLReportGenerator:
                 <span style="font-size:40px;">𝕏</span>
                 <h1 style="font-size:28px;font-weight:700;">数据分析报告</h1>
             </div>
-            <p style="color:{text_muted};font-size:14px;">
-                搜索关键词: <span style="color:{accent};font-weight:600;">"{data.query}"</span> · 
-                生成时间: {data.generated_at}
+            <p style="color:$text_muted;font-size:14px;">
+                搜索关键词: <span style="color:$accent;font-weight:600;">"{query}"</span> · 
+                生成时间: {generated_at}
             </p>
         </div>
         
         <!-- Stats Cards -->
         <div style="display:grid;grid-template-columns:repeat(5,1fr);gap:16px;margin-bottom:24px;">
-            <div style="background:{card_bg};padding:20px;border-radius:16px;text-align:center;">
-                <div style="font-size:28px;font-weight:700;color:{accent};">{data.total_tweets:,}</div>
-                <div style="color:{text_muted};font-size:13px;margin-top:4px;">推文总数</div>
+            <div style="background:$card_bg;padding:20px;border-radius:16px;text-align:center;">
+                <div style="font-size:28px;font-weight:700;color:$accent;">{total_tweets:,}</div>
+                <div style="color:$text_muted;font-size:13px;margin-top:4px;">推文总数</div>
             </div>
-            <div style="background:{card_bg};padding:20px;border-radius:16px;text-align:center;">
-                <div style="font-size:28px;font-weight:700;color:{danger};">{format_num(data.total_likes)}</div>
-                <div style="color:{text_muted};font-size:13px;margin-top:4px;">❤️ 总点赞</div>
+            <div style="background:$card_bg;padding:20px;border-radius:16px;text-align:center;">
+                <div style="font-size:28px;font-weight:700;color:$danger;">{total_likes}</div>
+                <div style="color:$text_muted;font-size:13px;margin-top:4px;">❤️ 总点赞</div>
             </div>
-            <div style="background:{card_bg};padding:20px;border-radius:16px;text-align:center;">
-                <div style="font-size:28px;font-weight:700;color:{success};">{format_num(data.total_retweets)}</div>
-                <div style="color:{text_muted};font-size:13px;margin-top:4px;">🔄 总转发</div>
+            <div style="background:$card_bg;padding:20px;border-radius:16px;text-align:center;">
+                <div style="font-size:28px;font-weight:700;color:$success;">{total_retweets}</div>
+                <div style="color:$text_muted;font-size:13px;margin-top:4px;">🔄 总转发</div>
             </div>
-            <div style="background:{card_bg};padding:20px;border-radius:16px;text-align:center;">
-                <div style="font-size:28px;font-weight:700;color:{warning};">{format_num(data.total_replies)}</div>
-                <div style="color:{text_muted};font-size:13px;margin-top:4px;">💬 总评论</div>
+            <div style="background:$card_bg;padding:20px;border-radius:16px;text-align:center;">
+                <div style="font-size:28px;font-weight:700;color:$warning;">{total_replies}</div>
+                <div style="color:$text_muted;font-size:13px;margin-top:4px;">💬 总评论</div>
             </div>
-            <div style="background:{card_bg};padding:20px;border-radius:16px;text-align:center;">
-                <div style="font-size:28px;font-weight:700;color:{accent2};">{format_num(data.total_views)}</div>
-                <div style="color:{text_muted};font-size:13px;margin-top:4px;">👁️ 总浏览</div>
+            <div style="background:$card_bg;padding:20px;border-radius:16px;text-align:center;">
+                <div style="font-size:28px;font-weight:700;color:$accent2;">{total_views}</div>
+                <div style="color:$text_muted;font-size:13px;margin-top:4px;">👁️ 总浏览</div>
             </div>
         </div>
         
         <!-- Charts Row -->
         <div style="display:grid;grid-template-columns:2fr 1fr;gap:24px;margin-bottom:24px;">
             <!-- Time Distribution -->
-            <div style="background:{card_bg};padding:24px;border-radius:16px;">
-                <h3 style="font-size:16px;margin-bottom:16px;color:{text_color};">📊 发布时间分布 (24小时)</h3>
+            <div style="background:$card_bg;padding:24px;border-radius:16px;">
+                <h3 style="font-size:16px;margin-bottom:16px;color:$text_color;">📊 发布时间分布 (24小时)</h3>
                 <div style="display:flex;align-items:flex-end;justify-content:space-between;height:80px;padding-top:10px;">
                     {hour_bars}
                 </div>
             </div>
             
             <!-- Sentiment Analysis -->
-            <div style="background:{card_bg};padding:24px;border-radius:16px;">
-                <h3 style="font-size:16px;margin-bottom:16px;color:{text_color};">😊 情感分析</h3>
+            <div style="background:$card_bg;padding:24px;border-radius:16px;">
+                <h3 style="font-size:16px;margin-bottom:16px;color:$text_color;">😊 情感分析</h3>
                 <div style="display:flex;flex-direction:column;gap:12px;">
                     <div style="display:flex;align-items:center;gap:12px;">
-                        <div style="width:100px;height:12px;background:{bg_color};border-radius:6px;overflow:hidden;">
-                            <div style="width:{pos_pct}%;height:100%;background:{success};"></div>
+                        <div style="width:100px;height:12px;background:$bg_color;border-radius:6px;overflow:hidden;">
+                            <div style="width:{pos_pct}%;height:100%;background:$success;"></div>
                         </div>
                         <span style="font-size:13px;">😊 正面 {pos_pct}%</span>
                     </div>
                     <div style="display:flex;align-items:center;gap:12px;">
-                        <div style="width:100px;height:12px;background:{bg_color};border-radius:6px;overflow:hidden;">
-                            <div style="width:{neu_pct}%;height:100%;background:{text_muted};"></div>
+                        <div style="width:100px;height:12px;background:$bg_color;border-radius:6px;overflow:hidden;">
+                            <div style="width:{neu_pct}%;height:100%;background:$text_muted;"></div>
                         </div>
                         <span style="font-size:13px;">😐 中性 {neu_pct}%</span>
                     </div>
                     <div style="display:flex;align-items:center;gap:12px;">
-                        <div style="width:100px;height:12px;background:{bg_color};border-radius:6px;overflow:hidden;">
-                            <div style="width:{neg_pct}%;height:100%;background:{danger};"></div>
+                        <div style="width:100px;height:12px;background:$bg_color;border-radius:6px;overflow:hidden;">
+                            <div style="width:{neg_pct}%;height:100%;background:$danger;"></div>
                         </div>
                         <span style="font-size:13px;">😢 负面 {neg_pct}%</span>
                     </div>
@@ -659,85 +842,310 @@ class HTMLReportGenerator:
         </div>
         
         <!-- Hashtags -->
-        <div style="background:{card_bg};padding:24px;border-radius:16px;margin-bottom:24px;">
-            <h3 style="font-size:16px;margin-bottom:16px;color:{text_color};">🏷️ 热门标签</h3>
+        <div style="background:$card_bg;padding:24px;border-radius:16px;margin-bottom:24px;">
+            <h3 style="font-size:16px;margin-bottom:16px;color:$text_color;">🏷️ 热门标签</h3>
             <div style="display:flex;flex-wrap:wrap;gap:8px;">
-                {hashtags_html if hashtags_html else f'<span style="color:{text_muted};">暂无标签数据</span>'}
+                {hashtags_html}
             </div>
         </div>
         
         <!-- Two Column: Authors & Top Tweets -->
         <div style="display:grid;grid-template-columns:1fr 1fr;gap:24px;">
             <!-- Top Authors -->
-            <div style="background:{card_bg};padding:24px;border-radius:16px;">
-                <h3 style="font-size:16px;margin-bottom:16px;color:{text_color};">👥 活跃用户 TOP 5</h3>
+            <div style="background:$card_bg;padding:24px;border-radius:16px;">
+                <h3 style="font-size:16px;margin-bottom:16px;color:$text_color;">👥 活跃用户 TOP 5</h3>
                 <div style="display:flex;flex-direction:column;gap:8px;">
-                    {authors_html if authors_html else f'<span style="color:{text_muted};">暂无用户数据</span>'}
+                    {authors_html}
                 </div>
             </div>
             
             <!-- Top Tweets -->
-            <div style="background:{card_bg};padding:24px;border-radius:16px;">
-                <h3 style="font-size:16px;margin-bottom:16px;color:{text_color};">🔥 热门推文</h3>
+            <div style="background:$card_bg;padding:24px;border-radius:16px;">
+                <h3 style="font-size:16px;margin-bottom:16px;color:$text_color;">🔥 热门推文</h3>
                 <div style="display:flex;flex-direction:column;gap:12px;">
-                    {tweets_html if tweets_html else f'<span style="color:{text_muted};">暂无推文数据</span>'}
+                    {tweets_html}
                 </div>
             </div>
         </div>
         
         <!-- Footer -->
-        <div style="text-align:center;margin-top:32px;padding-top:24px;border-top:1px solid {card_bg};">
-            <p style="color:{text_muted};font-size:12px;">
-                📊 由 X Report Generator 生成 · 平均互动率: {data.avg_engagement:.1f} · 数据来源: x.com
+        <div style="text-align:center;margin-top:32px;padding-top:24px;border-top:1px solid $card_bg;">
+            <p style="color:$text_muted;font-size:12px;">
+                📊 由 X Report Generator 生成 · 平均互动率: {avg_engagement:.1f} · 数据来源: x.com
             </p>
         </div>
     </div>
 </body>
 </html>'''
+
+_THEME_SKELETONS = {name: Template(_REPORT_TEMPLATE).substitute(colors) for name, colors in THEMES.items()}
+
+
+@dataclass
+class Rendered:
+    """生成的HTML报告；UTF-8字节只编码一次，写文件时直接使用"""
+    text: str
+    utf8: bytes = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.utf8 = self.text.encode('utf-8')
+
+
+class HTMLReportGenerator:
+    """HTML报告生成器"""
+    
+    def __init__(self, theme: str = "dark"):
+        self.theme = theme
+        self.colors = THEMES["dark" if theme == "dark" else "light"]
+        # 主题相关的静态部分只生成一次，generate() 只填充动态数据
+        self._skeleton = _THEME_SKELETONS["dark" if theme == "dark" else "light"]
+    
+    def generate(self, data: ReportData) -> Rendered:
+        """生成HTML报告"""
+        # 主题颜色
+        text_color = self.colors["text_color"]
+        text_muted = self.colors["text_muted"]
+        bg_color = self.colors["bg_color"]
+        accent = self.colors["accent"]
+        accent2 = self.colors["accent2"]
+        
+        # 生成时间分布图表数据
+        hours = list(range(24))
+        hour_values = [data.hourly_distribution.get(str(h), 0) for h in hours]
+        max_hour_val = max(hour_values) if hour_values else 1
+        hour_bars_parts = []
+        for h, v in zip(hours, hour_values):
+            height = int((v / max_hour_val) * 60) if max_hour_val > 0 else 0
+            hour_bars_parts.append(f'''
+                <div style="display:flex;flex-direction:column;align-items:center;gap:4px;">
+                    <div style="width:12px;height:{height}px;background:linear-gradient(to top,{accent},{accent2});border-radius:4px;min-height:2px;"></div>
+                    <span style="font-size:10px;color:{text_muted};">{h}</span>
+                </div>
+            ''')
+        hour_bars = ''.join(hour_bars_parts)
+        
+        # 生成情感分析
+        total_sentiment = data.sentiment_positive + data.sentiment_neutral + data.sentiment_negative
+        if total_sentiment > 0:
+            pos_pct = int((data.sentiment_positive / total_sentiment) * 100)
+            neu_pct = int((data.sentiment_neutral / total_sentiment) * 100)
+            neg_pct = 100 - pos_pct - neu_pct
+        else:
+            pos_pct, neu_pct, neg_pct = 0, 0, 0
         
-        return html
+        # 生成热门标签HTML
+        hashtags_parts = []
+        for tag in data.top_hashtags[:8]:
+            hashtags_parts.append(f'''
+                <span style="background:{accent}22;color:{accent};padding:6px 12px;border-radius:20px;font-size:13px;">
+                    #{tag['tag']} <span style="color:{text_muted};">({tag['count']})</span>
+                </span>
+            ''')
+        hashtags_html = ''.join(hashtags_parts)
+        
+        # 生成热门作者HTML
+        authors_parts = []
+        for i, author in enumerate(data.top_authors[:5], 1):
+            avatar = author.get('avatar', '')
+            avatar_html = f'<img src="{avatar}" style="width:32px;height:32px;border-radius:50%;">' if avatar and avatar.startswith('http') else f'<span style="font-size:20px;width:32px;text-align:center;">👤</span>'
+            authors_parts.append(f'''
+                <div style="display:flex;align-items:center;gap:12px;padding:12px;background:{bg_color};border-radius:8px;">
+                    {avatar_html}
+                    <div style="flex:1;min-width:0;">
+                        <div style="font-weight:600;color:{text_color};white-space:nowrap;overflow:hidden;text-overflow:ellipsis;">@{author['author']}</div>
+                        <div style="font-size:12px;color:{text_muted};">{author['tweets']} 推文 · {author['engagement']:,} 互动</div>
+                    </div>
+                    <span style="background:{accent};color:white;padding:4px 8px;border-radius:4px;font-size:12px;">#{i}</span>
+                </div>
+            ''')
+        authors_html = ''.join(authors_parts)
+        
+        # 生成热门推文HTML
+        tweets_parts = []
+        for tweet in data.top_tweets[:3]:
+            avatar = tweet.get('author_avatar', '')
+            avatar_html = f'<img src="{avatar}" style="width:24px;height:24px;border-radius:50%;">' if avatar and avatar.startswith('http') else '<span style="font-size:18px;">👤</span>'
+            text_preview = tweet['text'][:150] + ('...' if len(tweet['text']) > 150 else '')
+            tweets_parts.append(f'''
+                <div style="padding:16px;background:{bg_color};border-radius:12px;border-left:4px solid {accent};">
+                    <div style="display:flex;align-items:center;gap:8px;margin-bottom:8px;">
+                        {avatar_html}
+                        <span style="font-weight:600;color:{text_color};">@{tweet['author']}</span>
+                    </div>
+                    <p style="color:{text_color};margin:0 0 12px 0;line-height:1.5;font-size:14px;">{text_preview}</p>
+                    <div style="display:flex;gap:16px;font-size:13px;color:{text_muted};">
+                        <span>❤️ {tweet['likes']:,}</span>
+                        <span>🔄 {tweet['retweets']:,}</span>
+                        <span>💬 {tweet['replies']:,}</span>
+                        <span>👁️ {tweet['views']:,}</span>
+                    </div>
+                </div>
+            ''')
+        tweets_html = ''.join(tweets_parts)
+        
+        # 格式化大数字
+        def format_num(n):
+            if n >= 1000000:
+                return f"{n/1000000:.1f}M"
+            elif n >= 1000:
+                return f"{n/1000:.1f}K"
+            return str(n)
+        
+        empty = '<span style="color:{};">{}</span>'.format
+        return Rendered(self._skeleton.format_map({
+            'query': data.query,
+            'generated_at': data.generated_at,
+            'total_tweets': data.total_tweets,
+            'total_likes': format_num(data.total_likes),
+            'total_retweets': format_num(data.total_retweets),
+            'total_replies': format_num(data.total_replies),
+            'total_views': format_num(data.total_views),
+            'avg_engagement': data.avg_engagement,
+            'hour_bars': hour_bars,
+            'pos_pct': pos_pct,
+            'neu_pct': neu_pct,
+            'neg_pct': neg_pct,
+            'hashtags_html': hashtags_html or empty(text_muted, '暂无标签数据'),
+            'authors_html': authors_html or empty(text_muted, '暂无用户数据'),
+            'tweets_html': tweets_html or empty(text_muted, '暂无推文数据'),
+        }))
+
+
+# 截图编码参数；报告背景不透明，JPEG/WebP比无损PNG编码更快、体积更小
+SCREENSHOT_FORMATS = {
+    "png": {"type": "png"},
+    "webp": {"type": "webp", "quality": 90},
+    "jpeg": {"type": "jpeg", "quality": 88},
+}
+
+
+def _image_format(output_path: str, image_format: str = None) -> str:
+    """确定图片格式：显式指定优先，否则按扩展名推断，默认PNG"""
+    if image_format:
+        return image_format
+    suffix = Path(output_path).suffix.lower()
+    if suffix in ('.jpg', '.jpeg'):
+        return "jpeg"
+    if suffix == '.webp':
+        return "webp"
+    return "png"
 
 
 class HTMLToImageConverter:
-    """HTML转图片转换器"""
+    """
+    HTML转图片转换器
     
-    def convert(self, html_content: str, output_path: str, width: int = 920, scale: float = 2.0) -> bool:
-        """将HTML转换为图片"""
+    backend='chromium'（默认）用Playwright截图；backend='wkhtml'用imgkit调用
+    wkhtmltoimage，启动开销小得多，但其WebKit内核不支持CSS Grid和flex gap，
+    布局会与Chromium略有差异。未安装imgkit或wkhtmltoimage时自动回退到Chromium。
+    """
+    
+    def __init__(self, backend: str = 'chromium', quiet: bool = False):
+        self.backend = backend
+        self.quiet = quiet
+    
+    def _render_wkhtml(self, html_content: str, width: int, scale: float,
+                       image_format: str) -> Optional[bytes]:
+        """用wkhtmltoimage渲染；后端不可用时返回None"""
+        if imgkit is None:
+            print("⚠️ 未安装imgkit (pip install imgkit)，改用Chromium")
+            return None
+        if image_format not in ('png', 'jpeg'):
+            print(f"⚠️ wkhtmltoimage不支持{image_format}格式，改用Chromium")
+            return None
+        options = {
+            'format': 'jpg' if image_format == 'jpeg' else 'png',
+            'width': int(width * scale),
+            'zoom': scale,
+            'disable-smart-width': '',
+            'quiet': '',
+        }
         try:
-            from playwright.sync_api import sync_playwright
-            
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page(
-                    viewport={"width": width, "height": 800},
-                    device_scale_factor=scale
-                )
+            # output_path传False时imgkit直接返回图片字节
+            return imgkit.from_string(html_content, False, options=options)
+        except OSError as e:
+            print(f"⚠️ wkhtmltoimage不可用，改用Chromium: {e}")
+            return None
+    
+    async def render_async(self, html_content: str, image_format: str = "png", width: int = 920,
+                           scale: float = 2.0, *, pool: BrowserPool = None,
+                           browser=None) -> Optional[bytes]:
+        """
+        将HTML渲染为内存中的图片字节，失败时返回None。
+        
+        传入pool（BrowserPool）或browser（已启动的Playwright Browser）时复用该浏览器，
+        只新建上下文；都不传时临时启动一个。image_format 为 png/webp/jpeg。
+        """
+        if self.backend == 'wkhtml':
+            image = await asyncio.to_thread(self._render_wkhtml, html_content, width, scale, image_format)
+            if image is not None:
+                return image
+        
+        owns_pool = pool is None and browser is None
+        if owns_pool:
+            pool = BrowserPool()
+        new_context = browser.new_context if browser is not None else pool.new_context
+        try:
+            context = await new_context(
+                viewport={"width": width, "height": 800},
+                device_scale_factor=scale
+            )
+            try:
+                page = await context.new_page()
                 
                 # 设置HTML内容
-                page.set_content(html_content)
+                await page.set_content(html_content)
                 
                 # 等待渲染完成
-                page.wait_for_load_state("networkidle")
-                page.wait_for_timeout(500)
-                
-                # 获取实际内容高度
-                body_height = page.evaluate("document.body.scrollHeight")
-                page.set_viewport_size({"width": width, "height": body_height + 64})
+                await page.wait_for_load_state("networkidle")
+                await page.wait_for_timeout(500)
                 
-                # 截图
-                page.screenshot(path=output_path, full_page=True)
-                
-                browser.close()
-                
-            print(f"✓ 报告图片已保存: {output_path}")
-            return True
+                # 整页截图，无需按内容高度调整视口再重新布局
+                return await page.screenshot(full_page=True, **SCREENSHOT_FORMATS[image_format])
+            finally:
+                await context.close()
             
         except ImportError:
             print("❌ 需要安装 playwright: pip install playwright && playwright install chromium")
-            return False
+            return None
         except Exception as e:
             print(f"❌ 转换失败: {e}")
+            return None
+        finally:
+            if owns_pool:
+                await pool.close()
+    
+    async def convert_async(self, html_content: str, output_path: str, width: int = 920,
+                            scale: float = 2.0, *, pool: BrowserPool = None, browser=None,
+                            image_format: str = None) -> bool:
+        """
+        将HTML转换为图片文件；渲染成功后一次写入，失败时不留下残缺文件。
+        
+        image_format 不传时按output_path扩展名推断，其余参数同 render_async。
+        """
+        image = await self.render_async(html_content, _image_format(output_path, image_format),
+                                        width, scale, pool=pool, browser=browser)
+        if image is None:
             return False
+        Path(output_path).write_bytes(image)
+        if not self.quiet:
+            print(f"✓ 报告图片已保存: {output_path}")
+        return True
+    
+    def convert(self, html_content: str, output_path: str, width: int = 920, scale: float = 2.0) -> bool:
+        """将HTML转换为图片"""
+        return asyncio.run(self.convert_async(html_content, output_path, width, scale))
+
+
+def _require_playwright():
+    """检查playwright是否可用；只在确实需要浏览器时调用，缓存命中等情况不必导入"""
+    try:
+        import playwright.async_api  # noqa: F401
+    except ImportError:
+        print("❌ 需要安装 playwright:")
+        print("   pip install playwright")
+        print("   playwright install chromium")
+        sys.exit(1)
 
 
 def main():
@@ -758,6 +1166,9 @@ def main():
   # 仅生成HTML
   %(prog)s search "coding" --html-only --output report.html
   
+  # 批量生成：queries.txt 每行一个关键词，报告输出到 reports/ 目录
+  %(prog)s search --queries-file queries.txt --output reports/
+  
   # 显示浏览器窗口（调试用）
   %(prog)s search "test" --no-headless --output report.png
   
@@ -773,14 +1184,25 @@ def main():
     
     # Search command
     p_search = subparsers.add_parser('search', help='搜索关键词并生成报告')
-    p_search.add_argument('query', help='搜索关键词')
+    p_search.add_argument('query', nargs='?', help='搜索关键词')
+    p_search.add_argument('--queries-file',
+                          help='批量模式：每行一个关键词（同时给出的 query 也加入批量），--output 为输出目录')
     p_search.add_argument('--limit', '-l', type=int, default=50, help='获取推文数量 (默认50)')
-    p_search.add_argument('--output', '-o', required=True, help='输出文件路径 (.png 或 .html)')
+    p_search.add_argument('--output', '-o', required=True,
+                          help='输出文件路径 (.png/.webp/.jpg 或 .html)；批量模式下为输出目录')
     p_search.add_argument('--theme', '-t', default='dark', choices=['dark', 'light'], help='报告主题')
     p_search.add_argument('--html-only', action='store_true', help='仅生成HTML，不转图片')
+    p_search.add_argument('--keep-html', action='store_true', help='生成图片的同时保存HTML')
     p_search.add_argument('--width', '-w', type=int, default=920, help='图片宽度')
     p_search.add_argument('--cookies', '-c', help='Cookies文件路径')
     p_search.add_argument('--no-headless', action='store_true', help='显示浏览器窗口')
+    p_search.add_argument('--save-tweets', help='边爬取边将原始推文保存为NDJSON文件（每行带 query 字段）')
+    p_search.add_argument('--no-cache', action='store_true', help='忽略缓存数据，重新爬取')
+    p_search.add_argument('--quiet', '-q', action='store_true', help='只输出错误和警告')
+    p_search.add_argument('--renderer', default='chromium', choices=['chromium', 'wkhtml'],
+                          help='图片渲染后端 (wkhtml需安装imgkit和wkhtmltoimage)')
+    p_search.add_argument('--format', '-f', dest='image_format', choices=list(SCREENSHOT_FORMATS),
+                          help='图片格式 (默认按输出文件扩展名推断)')
     
     # User command
     p_user = subparsers.add_parser('user', help='分析用户推文')
@@ -789,9 +1211,17 @@ def main():
     p_user.add_argument('--output', '-o', required=True, help='输出文件路径')
     p_user.add_argument('--theme', '-t', default='dark', choices=['dark', 'light'])
     p_user.add_argument('--html-only', action='store_true')
+    p_user.add_argument('--keep-html', action='store_true', help='生成图片的同时保存HTML')
     p_user.add_argument('--width', '-w', type=int, default=920)
     p_user.add_argument('--cookies', '-c', help='Cookies文件路径')
     p_user.add_argument('--no-headless', action='store_true')
+    p_user.add_argument('--save-tweets', help='边爬取边将原始推文保存为NDJSON文件（每行带 query 字段）')
+    p_user.add_argument('--no-cache', action='store_true', help='忽略缓存数据，重新爬取')
+    p_user.add_argument('--quiet', '-q', action='store_true', help='只输出错误和警告')
+    p_user.add_argument('--renderer', default='chromium', choices=['chromium', 'wkhtml'],
+                        help='图片渲染后端 (wkhtml需安装imgkit和wkhtmltoimage)')
+    p_user.add_argument('--format', '-f', dest='image_format', choices=list(SCREENSHOT_FORMATS),
+                        help='图片格式 (默认按输出文件扩展名推断)')
     
     # Login command - 保存cookies
     p_login = subparsers.add_parser('login', help='登录并保存cookies')
@@ -799,77 +1229,174 @@ def main():
     
     args = parser.parse_args()
     
-    # 检查playwright
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        print("❌ 需要安装 playwright:")
-        print("   pip install playwright")
-        print("   playwright install chromium")
-        sys.exit(1)
+    # 启动浏览器前先校验输入，无效输入直接退出
+    if args.command == 'search':
+        queries = [args.query.strip()] if args.query is not None else []
+        if args.queries_file:
+            with open(args.queries_file, 'r', encoding='utf-8') as f:
+                file_queries = [line.strip() for line in f if line.strip()]
+            if not file_queries:
+                parser.error(f"关键词文件为空: {args.queries_file}")
+            queries += file_queries
+        elif not queries:
+            parser.error("请提供搜索关键词或 --queries-file")
+        for query in queries:
+            if not query or len(query) > MAX_QUERY_LENGTH:
+                parser.error(f"搜索关键词不能为空且不超过{MAX_QUERY_LENGTH}个字符")
+        args.queries = list(dict.fromkeys(queries))
+    elif args.command == 'user':
+        args.username = args.username.strip().lstrip('@')
+        if not _USERNAME_RE.match(args.username):
+            parser.error(f"无效的用户名: {args.username} (仅限字母、数字、下划线，最长15位)")
     
     # 登录模式
     if args.command == 'login':
+        _require_playwright()
         scraper = XBrowserScraper(headless=False)
         scraper.save_cookies(args.cookies)
         return
     
-    # 初始化爬虫
+    asyncio.run(run_report(args))
+
+
+async def run_report(args):
+    """爬取、分析并输出报告；爬取和截图共用同一个浏览器"""
     headless = not getattr(args, 'no_headless', False)
-    cookies_file = getattr(args, 'cookies', None)
-    scraper = XBrowserScraper(headless=headless, cookies_file=cookies_file)
-    analyzer = DataAnalyzer()
+    pool = BrowserPool(headless=headless)
+    try:
+        await _generate_report(args, pool)
+    finally:
+        await pool.close()
+
+
+def _batch_output_paths(args, queries: List[str]) -> dict:
+    """
+    批量模式下每个关键词的输出文件路径：<输出目录>/<关键词>.<扩展名>
+    
+    不同关键词清理后可能得到同一个文件名（如 "AI/ML" 和 "AI ML"），重名时追加 _2、_3 ...
+    按小写比较，避免在不区分大小写的文件系统上互相覆盖。
+    """
+    if args.html_only:
+        suffix = '.html'
+    else:
+        suffix = '.jpg' if args.image_format == 'jpeg' else f".{args.image_format or 'png'}"
+    paths = {}
+    used = set()
+    for query in queries:
+        base = _UNSAFE_FILENAME_RE.sub('_', query).strip('._')
+        if not base:
+            base = hashlib.sha1(query.encode('utf-8')).hexdigest()[:12]
+        name = base
+        n = 1
+        while name.lower() in used:
+            n += 1
+            name = f"{base}_{n}"
+        used.add(name.lower())
+        paths[query] = str(Path(args.output) / f"{name}{suffix}")
+    return paths
+
+
+def _status(args, *lines: str):
+    """一次写出多行状态信息；--quiet 时不输出"""
+    if not args.quiet:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+async def _generate_report(args, pool: BrowserPool):
+    _status(args, "=" * 50, "🐦 X (Twitter) 数据分析报告生成器", "=" * 50)
     
-    print("=" * 50)
-    print("🐦 X (Twitter) 数据分析报告生成器")
-    print("=" * 50)
+    targets = args.queries if args.command == 'search' else [args.username]
+    batch = args.command == 'search' and bool(args.queries_file)
     
-    # 获取数据
-    if args.command == 'search':
-        tweets = scraper.search_tweets(args.query, args.limit)
-        report_data = analyzer.analyze(tweets, args.query, "search")
-    elif args.command == 'user':
-        tweets = scraper.get_user_tweets(args.username, args.limit)
-        report_data = analyzer.analyze(tweets, f"@{args.username}", "user")
+    # 需要保存原始推文时必须重新爬取，不读缓存
+    reports = {}
+    if not args.no_cache and not args.save_tweets:
+        for target in targets:
+            report_data = load_cached_report(args.command, target, args.limit)
+            if report_data is not None:
+                reports[target] = report_data
+                _status(args, f"♻️ 使用{CACHE_TTL // 60}分钟内的缓存数据: {target} (--no-cache 强制重新爬取)")
     
-    if not tweets:
+    missing = [target for target in targets if target not in reports]
+    if missing:
+        _require_playwright()
+        
+        # 初始化爬虫；多个目标共用同一个浏览器上下文并发爬取
+        headless = not getattr(args, 'no_headless', False)
+        cookies_file = getattr(args, 'cookies', None)
+        scraper = XBrowserScraper(headless=headless, cookies_file=cookies_file, pool=pool,
+                                  tweets_file=args.save_tweets, quiet=args.quiet)
+        analyzer = DataAnalyzer()
+        
+        # 获取数据
+        results = await scraper.scrape_many([(args.command, target) for target in missing], args.limit)
+        for target, (tweets, stats) in zip(missing, results):
+            if not tweets:
+                if batch:
+                    print(f"⚠️ 未能获取到数据，已跳过: {target}")
+                continue
+            if args.command == 'search':
+                report_data = analyzer.analyze(tweets, target, "search", stats)
+            else:
+                report_data = analyzer.analyze(tweets, f"@{target}", "user", stats)
+            save_cached_report(args.command, target, args.limit, report_data)
+            reports[target] = report_data
+    
+    if not reports:
         print("\n❌ 未能获取到数据，请检查:")
         print("   1. 网络连接是否正常")
         print("   2. 是否需要登录 (使用 login 命令保存cookies)")
         print("   3. 搜索关键词是否有效")
         sys.exit(1)
     
-    print(f"\n📊 数据分析完成: {report_data.total_tweets} 条推文")
-    print(f"   总点赞: {report_data.total_likes:,}")
-    print(f"   总转发: {report_data.total_retweets:,}")
-    print(f"   总评论: {report_data.total_replies:,}")
+    if batch:
+        Path(args.output).mkdir(parents=True, exist_ok=True)
+        output_paths = _batch_output_paths(args, targets)
+    for target in targets:
+        if target in reports:
+            output_path = output_paths[target] if batch else args.output
+            await _output_report(args, reports[target], output_path, pool)
+    
+    _status(args, "\n✅ 报告生成完成!")
+
+
+async def _output_report(args, report_data: ReportData, output_path: str, pool: BrowserPool):
+    """打印统计摘要，生成HTML并输出为HTML或图片"""
+    _status(args,
+            f"\n📊 数据分析完成: {report_data.total_tweets} 条推文",
+            f"   总点赞: {report_data.total_likes:,}",
+            f"   总转发: {report_data.total_retweets:,}",
+            f"   总评论: {report_data.total_replies:,}")
     
     # 生成HTML
     html_generator = HTMLReportGenerator(theme=args.theme)
-    html_content = html_generator.generate(report_data)
-    
-    # 输出
-    output_path = args.output
+    rendered = html_generator.generate(report_data)
     
     if args.html_only or output_path.endswith('.html'):
         # 仅保存HTML
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print(f"\n✓ HTML报告已保存: {output_path}")
+        Path(output_path).write_bytes(rendered.utf8)
+        _status(args, f"\n✓ HTML报告已保存: {output_path}")
     else:
+        html_path = output_path.rsplit('.', 1)[0] + '.html'
+        
+        # --keep-html: 截图渲染期间在线程中同时写入HTML
+        html_write = None
+        if args.keep_html:
+            html_write = asyncio.create_task(asyncio.to_thread(Path(html_path).write_bytes, rendered.utf8))
+        
         # 转换为图片
-        converter = HTMLToImageConverter()
-        success = converter.convert(html_content, output_path, width=args.width)
+        converter = HTMLToImageConverter(backend=args.renderer, quiet=args.quiet)
+        success = await converter.convert_async(rendered.text, output_path, width=args.width, pool=pool,
+                                                image_format=args.image_format)
         
+        if html_write is not None:
+            await html_write
+            _status(args, f"✓ HTML报告已保存: {html_path}")
         if not success:
-            # 如果转换失败，保存HTML
-            html_path = output_path.rsplit('.', 1)[0] + '.html'
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # 如果转换失败，保存HTML（--keep-html时已经写入）
+            if html_write is None:
+                Path(html_path).write_bytes(rendered.utf8)
             print(f"⚠️ 图片生成失败，已保存HTML: {html_path}")
-    
-    print("\n✅ 报告生成完成!")
-
 
 if __name__ == "__main__":
     main()